@@ -0,0 +1,174 @@
+import os
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+# Fixtures de test_rendimiento.py y test_servicio.py: una carga horaria sintética fija (semilla
+# constante) y sus listas de inscritos, creadas una sola vez por sesión, y la línea base de
+# benchmark_exportador.json con la que se comparan las métricas de rendimiento.
+#
+#   python -m pytest -q                                  compara con la línea base
+#   python -m pytest -q --umbral-rendimiento 0.4         tolera caídas de hasta 40 %
+#   EXPORTADOR_UMBRAL=0.4 python -m pytest -q            igual, por variable de entorno
+#   python -m pytest -q --guardar-rendimiento            guarda las cifras de esta máquina
+
+RUTA_BASE = Path(__file__).with_name("benchmark_exportador.json")
+PLANTILLA = Path(__file__).with_name("plantilla_lista_estudiantes.xlsx")
+MES = "JUNIO 2025"
+IDIOMAS = ["INGLÉS", "PORTUGUÉS", "ITALIANO", "QUECHUA"]
+CURSOS_POR_IDIOMA = 250
+CURSOS_EXPORTADOS = 20
+ESTUDIANTES_POR_CURSO = 25
+UMBRAL_POR_DEFECTO = 0.25
+
+COLUMNAS_CARGA = [
+    "CODIGO", "CICLO", "MODALIDAD", "DOCENTE", "DIAS", "HORAS", "F. Inicio", "F. Fin", "Parcial", "Final",
+    "Subida de notas", "Nª inscritos", "N° Aprobados", "N° Desaprobados", "N° No asistio (tiene 0)",
+    "Destalle del curso",
+]
+HORARIOS = [
+    ("LUNES, MIÉRCOLES Y VIERNES", "19:00 - 21:00"),
+    ("MARTES Y JUEVES", "07:00 - 09:15"),
+    ("SÁBADOS", "09:00 - 13:00"),
+    ("LUNES, MARTES Y MIÉRCOLES", "08:00 - 10:00, 18:00 - 20:00"),
+]
+
+
+def pytest_addoption(parser):
+    parser.addoption("--umbral-rendimiento", type=float, default=None,
+                     help="caída máxima tolerada respecto de benchmark_exportador.json (0.25 = 25%%)")
+    parser.addoption("--guardar-rendimiento", action="store_true",
+                     help="guarda las métricas medidas como nueva línea base en vez de comparar")
+
+
+# ========== FIXTURES DE DATOS ==========
+
+@pytest.fixture(scope="session")
+def mes():
+    return MES
+
+
+@pytest.fixture(scope="session")
+def plantilla():
+    return PLANTILLA
+
+
+@pytest.fixture(scope="session")
+def carpeta_datos(tmp_path_factory):
+    return tmp_path_factory.mktemp("datos")
+
+
+@pytest.fixture(scope="session")
+def carga_horaria(carpeta_datos):
+    # Misma estructura que la carga horaria real: título, encabezado, un bloque por idioma
+    # (cada uno con su fila de título y encabezado) y la fila MATRÍCULA al final
+    from openpyxl import Workbook
+
+    azar = random.Random(2025)
+    wb = Workbook()
+    ws = wb.active
+    ws.title = MES
+    ws.append(["CARGA HORARIA"])
+    ws.append(COLUMNAS_CARGA)
+    codigo = 25060000
+    for idioma in IDIOMAS:
+        if idioma != "INGLÉS":
+            ws.append([idioma])
+            ws.append(COLUMNAS_CARGA)
+        for k in range(CURSOS_POR_IDIOMA):
+            codigo += 1
+            dias, horas = azar.choice(HORARIOS)
+            ws.append([
+                codigo, azar.choice(["B1", "B2", "I3", "A10", "REPASO"]),
+                azar.choice(["regular", "intensivo", "superintensivo"]),
+                f"DOCENTE {idioma[:3]} {k % 12}" if k % 3 else None, dias, horas,
+                "2025-06-02", "2025-06-27", "2025-06-14", "2025-06-26", "2025-06-30",
+                f"{azar.randint(5, 30)}/30", 10, 2, 1, "x",
+            ])
+    ws.append(["MATRÍCULA"])
+    ws.append([99999999])
+    ruta = carpeta_datos / "Carga_Horaria_2025.xlsx"
+    wb.save(ruta)
+    return ruta
+
+
+@pytest.fixture(scope="session")
+def df_cursos(carga_horaria):
+    from exportador_core import clean_df_mes_idioma
+
+    return clean_df_mes_idioma(carga_horaria, MES)
+
+
+@pytest.fixture(scope="session")
+def codigos_con_inscritos(df_cursos):
+    # Los primeros CURSOS_EXPORTADOS cursos tienen lista de inscritos; el resto no
+    return list(df_cursos["CODIGO"])[:CURSOS_EXPORTADOS]
+
+
+@pytest.fixture(scope="session")
+def carpeta_inscritos(carpeta_datos, codigos_con_inscritos):
+    import pandas as pd
+
+    carpeta = carpeta_datos / "inscritos"
+    carpeta.mkdir()
+    for codigo in codigos_con_inscritos:
+        pd.DataFrame({
+            "CODIGO_CURSO": [codigo] * ESTUDIANTES_POR_CURSO,
+            "NOMBRES": [f"ESTUDIANTE {i}" for i in range(ESTUDIANTES_POR_CURSO)],
+            "CORREO": [f"e{i}@correo.pe" for i in range(ESTUDIANTES_POR_CURSO)],
+            "CELULAR": [f"9{i:08d}" for i in range(ESTUDIANTES_POR_CURSO)],
+        }).to_excel(carpeta / f"Inscritos_{codigo}.xlsx", index=False)
+    return carpeta
+
+
+# ========== LÍNEA BASE ==========
+
+_medidas = {}
+
+
+@pytest.fixture(scope="session")
+def linea_base():
+    if RUTA_BASE.exists():
+        return json.loads(RUTA_BASE.read_text(encoding="utf-8"))
+    return {}
+
+
+@pytest.fixture(scope="session")
+def umbral(request, linea_base):
+    # Prioridad: opción de pytest, variable EXPORTADOR_UMBRAL, valor guardado en la línea base
+    if request.config.getoption("--umbral-rendimiento") is not None:
+        return request.config.getoption("--umbral-rendimiento")
+    if os.environ.get("EXPORTADOR_UMBRAL"):
+        return float(os.environ["EXPORTADOR_UMBRAL"])
+    return linea_base.get("umbral", UMBRAL_POR_DEFECTO)
+
+
+@pytest.fixture
+def comparar_con_base(request, linea_base, umbral):
+    # comparar_con_base(nombre, valor): falla si valor cae más del umbral bajo la línea base
+    def comparar(nombre, valor):
+        _medidas[nombre] = valor
+        if request.config.getoption("--guardar-rendimiento"):
+            return
+        referencia = linea_base.get("metricas", {}).get(nombre)
+        if referencia is None:
+            pytest.skip(f"{nombre}: sin línea base (usa --guardar-rendimiento)")
+        cambio = valor / referencia - 1
+        assert cambio >= -umbral, (
+            f"{nombre}: {valor:,.1f} vs base {referencia:,.1f} ({cambio:+.0%}, umbral -{umbral:.0%})"
+        )
+    return comparar
+
+
+def pytest_sessionfinish(session):
+    if not session.config.getoption("--guardar-rendimiento") or not _medidas:
+        return
+    guardado = json.loads(RUTA_BASE.read_text(encoding="utf-8")) if RUTA_BASE.exists() else {}
+    umbral = session.config.getoption("--umbral-rendimiento")
+    if umbral is None:
+        umbral = guardado.get("umbral", UMBRAL_POR_DEFECTO)
+    metricas = {**guardado.get("metricas", {}), **{k: round(v, 1) for k, v in _medidas.items()}}
+    RUTA_BASE.write_text(json.dumps({"umbral": umbral, "metricas": metricas}, indent=2, ensure_ascii=False) + "\n",
+                         encoding="utf-8")
@@ -0,0 +1,205 @@
+import sys
+import argparse
+from pathlib import Path
+
+from exportador_core import (
+    COLUMNAS_FINALES, DIAS_VALIDOS, cargar_config, clean_df_mes_idioma, resolver_inscritos,
+    archivos_emparejados, normalizar_codigo, exportar_inscritos_formato_morado, nombres_archivo_cursos,
+)
+
+# Compara dos versiones de la carga horaria (dos hojas o dos archivos) ya limpias con
+# clean_df_mes_idioma, usando CODIGO como clave. Cada fila se reduce a un hash para separar
+# rápido los cursos sin cambios; solo los modificados se comparan campo por campo.
+#
+# Uso: python diff_carga_horaria.py ANTES.xlsx "JUNIO 2025" [DESPUES.xlsx] "JUNIO 2025" [--reexportar [--borrar-obsoletos]]
+
+CAMPOS_COMPARADOS = [c for c in COLUMNAS_FINALES if c != "CODIGO"]
+
+# Campos que cambian el archivo exportado (nombre, cabecera G2-I2): si solo cambian otros
+# campos (p. ej. N° Aprobados), no hace falta volver a exportar el curso.
+CAMPOS_EXPORTACION = [
+    "Nivel", "Ciclo", "MODALIDAD", "DOCENTE", "IDIOMA", "HORARIO DETALLADO", "F. Inicio", "F. Fin",
+]
+
+
+def _hora(hora):
+    return hora.strftime("%H:%M") if hora is not None else "?"
+
+
+def _normalizar(df):
+    # Texto canónico por celda: dicts ordenados, listas/tuplas como lista y nulos como ""
+    import pandas as pd
+
+    def canonico(valor):
+        if isinstance(valor, dict):
+            return "; ".join(f"{DIAS_VALIDOS[dia]} {_hora(ini)}-{_hora(fin)}" for dia, (ini, fin) in sorted(valor.items()))
+        if isinstance(valor, (list, tuple)):
+            return repr(list(valor))
+        if valor is None or (not isinstance(valor, str) and pd.isna(valor)):
+            return ""
+        if hasattr(valor, "date") and callable(valor.date):
+            valor = valor.date()  # Timestamp (modo compacto) y date se comparan igual
+        return str(valor)
+
+    normal = pd.DataFrame({"CODIGO": df["CODIGO"].map(normalizar_codigo)})
+    for col in CAMPOS_COMPARADOS:
+        if col in df.columns:
+            normal[col] = df[col].astype(object).map(canonico)
+        else:
+            normal[col] = ""
+    normal = normal.drop_duplicates("CODIGO", keep="first").reset_index(drop=True)
+    normal["_hash"] = pd.util.hash_pandas_object(normal[CAMPOS_COMPARADOS], index=False).values
+    return normal
+
+
+def comparar_cargas(df_antes, df_despues):
+    # Devuelve (resumen, detalle):
+    #   resumen: CODIGO, ESTADO ("agregado" / "eliminado" / "modificado"), CAMPOS (lista)
+    #   detalle: CODIGO, CAMPO, ANTES, DESPUES para cada campo modificado
+    import numpy as np
+    import pandas as pd
+
+    antes = _normalizar(df_antes)
+    despues = _normalizar(df_despues)
+    unidos = antes.merge(despues, on="CODIGO", how="outer", suffixes=("_antes", "_despues"), indicator=True)
+
+    agregados = unidos[unidos["_merge"] == "right_only"]
+    eliminados = unidos[unidos["_merge"] == "left_only"]
+    ambos = unidos[unidos["_merge"] == "both"]
+    modificados = ambos[ambos["_hash_antes"] != ambos["_hash_despues"]]
+
+    # Comparación campo por campo, vectorizada sobre todos los modificados a la vez
+    valores_antes = modificados[[f"{c}_antes" for c in CAMPOS_COMPARADOS]].to_numpy()
+    valores_despues = modificados[[f"{c}_despues" for c in CAMPOS_COMPARADOS]].to_numpy()
+    distintos = valores_antes != valores_despues
+    filas, columnas = np.nonzero(distintos)
+    detalle = pd.DataFrame({
+        "CODIGO": modificados["CODIGO"].to_numpy()[filas],
+        "CAMPO": np.array(CAMPOS_COMPARADOS, dtype=object)[columnas],
+        "ANTES": valores_antes[filas, columnas],
+        "DESPUES": valores_despues[filas, columnas],
+    })
+
+    campos_por_codigo = detalle.groupby("CODIGO", sort=False)["CAMPO"].agg(list)
+    resumen = pd.concat([
+        pd.DataFrame({"CODIGO": agregados["CODIGO"], "ESTADO": "agregado"}),
+        pd.DataFrame({"CODIGO": eliminados["CODIGO"], "ESTADO": "eliminado"}),
+        pd.DataFrame({"CODIGO": modificados["CODIGO"], "ESTADO": "modificado"}),
+    ], ignore_index=True)
+    resumen["CAMPOS"] = resumen["CODIGO"].map(campos_por_codigo)
+    resumen["CAMPOS"] = resumen["CAMPOS"].map(lambda c: c if isinstance(c, list) else [])
+    return resumen, detalle
+
+
+def comparar_archivos(ruta_antes, mes_antes, ruta_despues, mes_despues):
+    # Devuelve (resumen, detalle, df_antes, df_despues)
+    df_antes = clean_df_mes_idioma(ruta_antes, mes_antes)
+    df_despues = clean_df_mes_idioma(ruta_despues, mes_despues)
+    return comparar_cargas(df_antes, df_despues) + (df_antes, df_despues)
+
+
+def _nombres_por_codigo(df):
+    return {normalizar_codigo(cod): nombre for cod, nombre in nombres_archivo_cursos(df).items()}
+
+
+def cursos_renombrados(df_antes, df_despues):
+    # El nombre de archivo de un curso depende también del resto de la hoja (los nombres que
+    # chocan llevan "(CODIGO)"), así que puede cambiar aunque sus campos no cambien
+    antes = _nombres_por_codigo(df_antes)
+    despues = _nombres_por_codigo(df_despues)
+    return sorted(cod for cod, nombre in despues.items() if cod in antes and antes[cod] != nombre)
+
+
+def salidas_obsoletas(df_antes, df_despues, carpeta_salida="./output/"):
+    # Archivos exportados con un nombre que ya no corresponde a ningún curso: cursos
+    # renombrados o eliminados de la carga horaria
+    vigentes = set(_nombres_por_codigo(df_despues).values())
+    viejos = set(_nombres_por_codigo(df_antes).values()) - vigentes
+    rutas = [Path(carpeta_salida) / f"{nombre}.xlsx" for nombre in sorted(viejos)]
+    return [ruta for ruta in rutas if ruta.exists()]
+
+
+def codigos_a_reexportar(resumen, renombrados=()):
+    # Cursos nuevos, cursos cuyo cambio afecta al archivo exportado y cursos cuyo nombre de
+    # archivo cambió (ver cursos_renombrados)
+    afecta = resumen["CAMPOS"].map(lambda campos: any(c in CAMPOS_EXPORTACION for c in campos))
+    seleccion = (resumen["ESTADO"] == "agregado") | ((resumen["ESTADO"] == "modificado") & afecta)
+    codigos = list(resumen.loc[seleccion, "CODIGO"])
+    return codigos + [cod for cod in renombrados if cod not in set(codigos)]
+
+
+def reexportar_afectados(resumen, df_despues, config, carpeta_entrada="inscritos/", carpeta_salida="./output/",
+                         df_antes=None):
+    renombrados = cursos_renombrados(df_antes, df_despues) if df_antes is not None else ()
+    afectados = set(codigos_a_reexportar(resumen, renombrados))
+    if not afectados:
+        print("No hay cursos que volver a exportar.")
+        return []
+    tabla = resolver_inscritos(carpeta_entrada, df_despues)
+    archivos_validos = [(cod, f) for cod, f in archivos_emparejados(tabla) if normalizar_codigo(cod) in afectados]
+    nombres_archivo = nombres_archivo_cursos(df_despues)
+    exportados = []
+    for cod, f in archivos_validos:
+        try:
+            exportados.append(exportar_inscritos_formato_morado(
+                cod, df_despues, config.get("feriados", []),
+                plantilla_path=config["plantilla"],
+                carpeta_entrada=carpeta_entrada,
+                carpeta_salida=carpeta_salida,
+                nombres_archivo=nombres_archivo,
+                archivos_inscritos=dict(archivos_validos),
+            ))
+        except Exception as e:
+            print(f"❌ Error exportando {f.name}: {e}")
+    sin_inscritos = afectados - {normalizar_codigo(cod) for cod, _ in archivos_validos}
+    if sin_inscritos:
+        print("⚠️ Cursos afectados sin archivo de inscritos:", ", ".join(sorted(sin_inscritos)))
+    return exportados
+
+
+def imprimir_diff(resumen, detalle):
+    for estado in ["agregado", "eliminado", "modificado"]:
+        codigos = resumen.loc[resumen["ESTADO"] == estado, "CODIGO"]
+        print(f"{estado.capitalize()}s: {len(codigos)}")
+    if not detalle.empty:
+        print()
+        print(detalle.to_string(index=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara dos versiones de la carga horaria por CODIGO")
+    parser.add_argument("argumentos", nargs="+", help="ANTES.xlsx MES_ANTES [DESPUES.xlsx] MES_DESPUES")
+    parser.add_argument("--reexportar", action="store_true", help="exporta de nuevo solo los cursos afectados")
+    parser.add_argument("--borrar-obsoletos", action="store_true",
+                        help="con --reexportar, borra las salidas de cursos renombrados o eliminados")
+    args = parser.parse_args()
+
+    if len(args.argumentos) == 3:
+        ruta_antes, mes_antes, mes_despues = args.argumentos
+        ruta_despues = ruta_antes
+    elif len(args.argumentos) == 4:
+        ruta_antes, mes_antes, ruta_despues, mes_despues = args.argumentos
+    else:
+        parser.error("se esperan 3 o 4 argumentos")
+
+    resumen, detalle, df_antes, df_despues = comparar_archivos(ruta_antes, mes_antes, ruta_despues, mes_despues)
+    imprimir_diff(resumen, detalle)
+    if args.reexportar:
+        config = cargar_config()
+        if "plantilla" not in config:
+            print("⚠️ Configura primero la plantilla (menu_exportador.py).")
+            sys.exit(1)
+        reexportar_afectados(resumen, df_despues, config, df_antes=df_antes)
+        obsoletos = salidas_obsoletas(df_antes, df_despues)
+        if obsoletos:
+            print("⚠️ Salidas de cursos renombrados o eliminados:")
+            for ruta in obsoletos:
+                print(f"- {ruta}")
+                if args.borrar_obsoletos:
+                    ruta.unlink()
+            if args.borrar_obsoletos:
+                print(f"🗑️ {len(obsoletos)} archivo(s) borrados.")
+
+
+if __name__ == "__main__":
+    main()
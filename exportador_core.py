@@ -0,0 +1,655 @@
+import io
+import re
+import json
+from datetime import datetime, time
+from pathlib import Path
+
+# pandas y openpyxl se importan dentro de cada función: importar este módulo
+# no debe costar nada hasta que realmente se limpie o exporte algo.
+
+# ========== CONFIGURACIÓN ==========
+
+CONFIG_FILE = "exportador_inscritos.config.json"
+
+IDIOMAS_VALIDOS = ["INGLÉS", "PORTUGUÉS", "ITALIANO", "QUECHUA"]
+
+IDIOMA_ABBR = {
+    "INGLÉS": "ING",
+    "PORTUGUÉS": "PORT",
+    "ITALIANO": "ITA",
+    "QUECHUA": "QUE"
+}
+NIVEL_ABBR = {
+    "Básico": "B",
+    "Intermedio": "I",
+    "Avanzado": "A"
+}
+MODALIDAD_ABBR = {
+    "regular": "REG",
+    "intensivo": "INT",
+    "súperintensivo": "SINT",
+    "superintensivo": "SINT",
+    "repaso": "REP"
+}
+DIA_COD = {0: "L", 1: "M", 2: "X", 3: "J", 4: "V", 5: "S", 6: "D"}
+
+DIAS_VALIDOS = ["LUNES", "MARTES", "MIÉRCOLES", "JUEVES", "VIERNES", "SÁBADOS", "DOMINGOS"]
+
+COLUMNAS_FINALES = [
+    "CODIGO", "Nivel", "Ciclo", "MODALIDAD", "DOCENTE", "IDIOMA", "DÍAS DETECTADOS",
+    "HORARIO DETALLADO", "F. Inicio", "F. Fin", "Parcial", "Final", "Subida de notas",
+    "N° Inscritos", "N° Esperado", "N° Aprobados", "N° Desaprobados",
+    "N° No asistio (tiene 0)", "Destalle del curso"
+]
+
+# Modo compacto: tipos para las columnas del DataFrame limpio
+CAMPOS_FECHA = ["F. Inicio", "F. Fin", "Parcial", "Final", "Subida de notas"]
+COLUMNAS_CATEGORICAS = ["IDIOMA", "MODALIDAD", "DOCENTE", "Nivel"]
+TIPOS_CONTADORES = {
+    "Ciclo": "Int8",
+    "N° Inscritos": "Int16",
+    "N° Esperado": "Int16",
+    "N° Aprobados": "Int16",
+    "N° Desaprobados": "Int16",
+    "N° No asistio (tiene 0)": "Int16",
+}
+
+
+def cargar_config():
+    if Path(CONFIG_FILE).exists():
+        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+def guardar_config(config):
+    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+        json.dump(config, f, ensure_ascii=False, indent=4)
+
+# ========== PARTE DE LIMPIEZA Y TRANSFORMACIÓN ==========
+
+def _como_conjunto(valor):
+    # Acepta un valor suelto o una lista de valores; None significa "sin filtro"
+    if valor is None:
+        return None
+    if isinstance(valor, str):
+        valor = [valor]
+    return {str(v).strip().upper() for v in valor}
+
+def _abreviar_modalidad(valor):
+    texto = str(valor).strip().lower()
+    return MODALIDAD_ABBR.get(texto, texto.upper())
+
+def filtrar_cursos(df, idioma=None, modalidad=None, docente=None, fecha_desde=None, fecha_hasta=None):
+    # Aplica los filtros sobre el DataFrame crudo (recién etiquetado con IDIOMA),
+    # antes del parseo costoso de nivel/ciclo, horarios y fechas.
+    import pandas as pd
+
+    idiomas = _como_conjunto(idioma)
+    if idiomas is not None:
+        df = df[df["IDIOMA"].astype(str).str.upper().isin(idiomas)]
+
+    modalidades = _como_conjunto(modalidad)
+    if modalidades is not None and "MODALIDAD" in df.columns:
+        # Se compara por abreviatura (REG/INT/SINT/REP): acepta el nombre completo con o sin
+        # tilde ("súperintensivo") o la abreviatura, en el filtro y en la columna.
+        # Los cursos de REPASO terminan con modalidad "repaso" tras la limpieza.
+        modalidades = {_abreviar_modalidad(m) for m in modalidades}
+        es_repaso = df.get("CICLO", pd.Series("", index=df.index)).astype(str).str.upper().str.contains("REPASO")
+        modalidad_efectiva = df["MODALIDAD"].map(_abreviar_modalidad).where(~es_repaso, "REP")
+        df = df[modalidad_efectiva.isin(modalidades)]
+
+    docentes = _como_conjunto(docente)
+    if docentes is not None:
+        df = df[df["DOCENTE"].astype(str).str.strip().str.upper().isin(docentes)]
+
+    # Ventana de fechas: se conservan los cursos que se cruzan con [fecha_desde, fecha_hasta]
+    if fecha_desde is not None:
+        fin = pd.to_datetime(df["F. Fin"], format="%Y-%m-%d", errors="coerce")
+        df = df[fin >= pd.Timestamp(fecha_desde)]
+    if fecha_hasta is not None:
+        inicio = pd.to_datetime(df["F. Inicio"], format="%Y-%m-%d", errors="coerce")
+        df = df[inicio <= pd.Timestamp(fecha_hasta)]
+
+    return df.copy()
+
+def compactar_df_cursos(df):
+    # Versión compacta del DataFrame limpio: categóricas para columnas de baja cardinalidad,
+    # fechas como datetime64 y enteros nulables pequeños para los contadores.
+    # HORARIO DETALLADO se mantiene como dict porque lo usan nombre_corto_curso y los prompts.
+    import pandas as pd
+
+    df = df.copy()
+    codigos = pd.to_numeric(df["CODIGO"], errors="coerce")
+    if codigos.notna().all():
+        df["CODIGO"] = codigos.astype("int64")
+    for col in COLUMNAS_CATEGORICAS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    if "DÍAS DETECTADOS" in df.columns:
+        # Las tuplas se comportan como las listas originales (join, índices, iteración)
+        df["DÍAS DETECTADOS"] = df["DÍAS DETECTADOS"].map(tuple).astype("category")
+    for col in CAMPOS_FECHA:
+        if col in df.columns:
+            # pandas no admite datetime64[D]; segundos es la resolución mínima disponible
+            df[col] = pd.to_datetime(df[col], errors="coerce").astype("datetime64[s]")
+    for col, tipo in TIPOS_CONTADORES.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(tipo)
+    return df
+
+def comparar_memoria(df, df_compacto):
+    # Uso de memoria por columna (en bytes, contando objetos Python) del formato actual vs compacto
+    import pandas as pd
+
+    actual = df.memory_usage(deep=True, index=False)
+    compacto = df_compacto.memory_usage(deep=True, index=False)
+    reporte = pd.DataFrame({"actual": actual, "compacto": compacto})
+    reporte.loc["TOTAL"] = reporte.sum()
+    reporte["ahorro %"] = (100 * (1 - reporte["compacto"] / reporte["actual"])).round(1)
+    return reporte
+
+def clean_df_mes_idioma(excel_path, mes, idioma=None, modalidad=None, docente=None, fecha_desde=None, fecha_hasta=None, compacto=False):
+    # Lee todos los cursos (de todos los idiomas) del mes seleccionado
+    import pandas as pd
+
+    df = pd.read_excel(excel_path, sheet_name=mes, skiprows=1)
+    matricula_idx = df[df.iloc[:, 0].astype(str).str.upper().str.contains("MATRÍCULA")].index
+    if not matricula_idx.empty:
+        df = df.loc[:matricula_idx[0] - 1]
+
+    df["IDIOMA"] = None
+    idioma_actual = "INGLÉS"
+    for i, row in df.iterrows():
+        cod_val = str(row.get("CODIGO", "")).strip().upper()
+        ciclo_val = str(row.get("CICLO", "")).strip().upper()
+        for nombre_idioma in IDIOMAS_VALIDOS[1:]:
+            if nombre_idioma in cod_val or nombre_idioma in ciclo_val:
+                idioma_actual = nombre_idioma
+                break
+        df.at[i, "IDIOMA"] = idioma_actual
+    df["IDIOMA"] = df["IDIOMA"].ffill()
+    df = df[df["CODIGO"].notna()]
+    df = df[~df["CODIGO"].astype(str).str.upper().isin(IDIOMAS_VALIDOS)]
+    df = df[~df["CODIGO"].astype(str).str.upper().str.contains("CODIGO")]
+    df["DOCENTE"] = df["DOCENTE"].ffill()
+
+    # Filtros opcionales: se aplican antes del parseo para procesar solo las filas necesarias
+    df = filtrar_cursos(df, idioma, modalidad, docente, fecha_desde, fecha_hasta)
+    if df.empty:
+        df = pd.DataFrame(columns=COLUMNAS_FINALES)
+        return compactar_df_cursos(df) if compacto else df
+
+    # Nivel y Ciclo
+    def extraer_nivel_y_ciclo(valor):
+        valor = str(valor).strip().upper()
+        if "REPASO" in valor:
+            return "", "", "repaso"
+        match = re.match(r"([BIA])(\d+)", valor)
+        if match:
+            nivel_map = {"B": "Básico", "I": "Intermedio", "A": "Avanzado"}
+            return nivel_map.get(match.group(1), ""), match.group(2), None
+        return "", "", None
+
+    niveles = []
+    ciclos = []
+    overrides = []
+    for valor in df.get("CICLO", []):
+        try:
+            result = extraer_nivel_y_ciclo(valor)
+            if not isinstance(result, (list, tuple)) or len(result) != 3:
+                result = ("", "", None)
+        except Exception:
+            result = ("", "", None)
+        nivel, ciclo, override = result
+        niveles.append(nivel)
+        ciclos.append(ciclo)
+        overrides.append(override)
+    df["Nivel"] = niveles if niveles else None
+    df["Ciclo"] = ciclos if ciclos else None
+    df["_mod_override"] = overrides if overrides else None
+
+    if "_mod_override" in df.columns and "MODALIDAD" in df.columns:
+        df["MODALIDAD"] = df.apply(
+            lambda row: row["_mod_override"] if pd.notna(row.get("_mod_override")) else row.get("MODALIDAD"),
+            axis=1
+        )
+        df.drop(columns=["_mod_override"], inplace=True)
+
+    # Días detectados
+    def extraer_dias(texto):
+        if pd.isna(texto): return []
+        texto = texto.upper().replace(" Y ", ", ")
+        dias_validos = ["LUNES", "MARTES", "MIÉRCOLES", "JUEVES", "VIERNES", "SÁBADOS", "DOMINGOS"]
+        return [d for d in map(str.strip, texto.split(",")) if d in dias_validos]
+
+    df["DÍAS DETECTADOS"] = df["DIAS"].apply(extraer_dias)
+
+    # Inscritos y esperados
+    def separar_inscritos(val):
+        if pd.isna(val): return pd.Series([None, None])
+        val = str(val).strip()
+        if "/" in val:
+            try:
+                num, esperado = val.split("/")
+                return pd.Series([int(num), int(esperado)])
+            except:
+                return pd.Series([None, None])
+        elif val.isdigit():
+            return pd.Series([int(val), None])
+        return pd.Series([None, None])
+
+    if "Nª inscritos" in df.columns:
+        df[["N° Inscritos", "N° Esperado"]] = df["Nª inscritos"].apply(separar_inscritos)
+    else:
+        df["N° Inscritos"] = None
+        df["N° Esperado"] = None
+
+    # Horario detallado estructurado
+    dia_a_codigo = {
+        "LUNES": 0, "MARTES": 1, "MIÉRCOLES": 2,
+        "JUEVES": 3, "VIERNES": 4, "SÁBADOS": 5, "DOMINGOS": 6
+    }
+    def parse_hora(hora_str):
+        try:
+            return datetime.strptime(hora_str.strip(), "%H:%M").time()
+        except:
+            return None
+
+    def mapear_horarios_especial(dias, horas):
+        if not isinstance(horas, str) or not dias:
+            return {}
+        bloques = [h.strip() for h in horas.split(",")]
+        resultado = {}
+        if len(bloques) == 2 and len(dias) >= 3:
+            try:
+                h1_inicio, h1_fin = map(parse_hora, bloques[0].split(" - "))
+                h2_inicio, h2_fin = map(parse_hora, bloques[1].split(" - "))
+                resultado[dia_a_codigo[dias[0]]] = (h1_inicio, h1_fin)
+                for d in dias[1:]:
+                    resultado[dia_a_codigo[d]] = (h2_inicio, h2_fin)
+            except:
+                return {}
+        elif len(bloques) == 1:
+            try:
+                h_inicio, h_fin = map(parse_hora, bloques[0].split(" - "))
+                for d in dias:
+                    resultado[dia_a_codigo[d]] = (h_inicio, h_fin)
+            except:
+                return {}
+        return resultado
+
+    df["HORARIO DETALLADO"] = df.apply(lambda row: mapear_horarios_especial(row["DÍAS DETECTADOS"], row["HORAS"]), axis=1)
+
+    # Fechas como date (con formato seguro)
+    for col in ["F. Inicio", "F. Fin", "Parcial", "Final", "Subida de notas"]:
+        df[col] = pd.to_datetime(df[col], format="%Y-%m-%d", errors='coerce').dt.date
+
+    # Convertir columnas a enteros o nulo
+    columnas_enteras = [
+        "Ciclo", "N° Inscritos", "N° Esperado",
+        "N° Aprobados", "N° Desaprobados", "N° No asistio (tiene 0)"
+    ]
+    for col in columnas_enteras:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+
+    df = df[COLUMNAS_FINALES].reset_index(drop=True)
+    if compacto:
+        df = compactar_df_cursos(df)
+    return df
+
+def nombre_corto_curso(codigo_curso, df):
+    fila = df[df["CODIGO"] == codigo_curso]
+    if fila.empty:
+        return f"❌ Código {codigo_curso} no encontrado."
+    return nombre_corto_fila(fila.iloc[0])
+
+def nombre_corto_fila(fila):
+    # fila puede ser una fila del DataFrame limpio o un dict con las mismas columnas
+    import pandas as pd
+
+    docente = str(fila["DOCENTE"]).strip()
+    idioma = IDIOMA_ABBR.get(str(fila["IDIOMA"]).upper(), str(fila["IDIOMA"])[:3].upper())
+    nivel = NIVEL_ABBR.get(fila["Nivel"], "NA")
+    ciclo = str(fila["Ciclo"]).zfill(2) if pd.notna(fila["Ciclo"]) else "00"
+    modalidad = MODALIDAD_ABBR.get(str(fila["MODALIDAD"]).lower(), "X")
+    dias_abbr = "".join([DIA_COD.get(dia, "?") for dia in sorted(fila["HORARIO DETALLADO"].keys())])
+    horas_unicas = sorted(set([
+        "-".join(f"{h.hour:02d}-{h.minute:02d}" for h in v if isinstance(h, time))
+        for v in fila["HORARIO DETALLADO"].values()
+        if isinstance(v, tuple) and all(isinstance(h, time) for h in v)
+    ]))
+    horario_final = "-".join(horas_unicas)
+    return f"{docente}-{idioma} {modalidad}{ciclo}({nivel})-{dias_abbr}-{horario_final}"
+
+def redactar_instrucciones(df):
+    instrucciones = "Estos son los horarios de los cursos:\n"
+    for _, row in df.iterrows():
+        codigo = row.get("CODIGO", "")
+        docente = row.get("DOCENTE", "")
+        idioma = row.get("IDIOMA", "")
+        dias = row.get("DÍAS DETECTADOS", [])
+        horas = row.get("HORARIO DETALLADO", {})
+        if not codigo or not horas:
+            continue
+        # Formatea días y horas
+        dias_str = ', '.join(dias) if dias else "-"
+        horas_str = []
+        for k, v in horas.items():
+            if isinstance(v, tuple) and all(v):
+                horas_str.append(f"{DIAS_VALIDOS[k]}: {v[0].strftime('%H:%M')} - {v[1].strftime('%H:%M')}")
+        horas_str = "; ".join(horas_str) if horas_str else "-"
+        instrucciones += f"- Curso {codigo} ({idioma}) dictado por {docente}: {dias_str} {horas_str}\n"
+    instrucciones += ("\nUtiliza esta información para responder dudas sobre horarios, docentes o idiomas de los cursos.")
+    return instrucciones
+
+def llenar_hoja_curso(ws, codigo_curso, df_curso, feriados, df_inscritos):
+    # Llena una hoja con el formato de la plantilla para un curso
+    from copy import copy
+    import pandas as pd
+
+    n_estudiantes = df_inscritos.shape[0]
+
+    # Copiar formato de la fila 2 (A-E) hacia abajo para cada estudiante.
+    # _style guarda los índices de fuente, borde, relleno, formato, protección y alineación
+    # en la tabla de estilos compartida del libro, así que basta con copiarlo.
+    for i in range(n_estudiantes):
+        source_row = 2
+        target_row = 2 + i
+        for col in range(1, 6):  # columnas A-E
+            cell_src = ws.cell(row=source_row, column=col)
+            cell_tgt = ws.cell(row=target_row, column=col)
+            cell_tgt._style = copy(cell_src._style)
+
+    # Llenar datos en las filas A3-E{n}
+    for idx, row in enumerate(df_inscritos.itertuples(index=False), start=2):
+        ws[f"A{idx}"] = idx - 1
+        ws[f"B{idx}"] = row.CODIGO_CURSO
+        ws[f"C{idx}"] = row.NOMBRES
+        ws[f"D{idx}"] = row.CORREO
+        ws[f"E{idx}"] = row.CELULAR
+
+    # Poner modalidad, nivel, ciclo en G2, fechas en H2 e I2
+    fila_curso = df_curso[df_curso["CODIGO"] == codigo_curso].iloc[0]
+    nivel = fila_curso["Nivel"]
+    ciclo = str(fila_curso["Ciclo"]).zfill(2) if pd.notna(fila_curso["Ciclo"]) else ""
+    modalidad_nivel_ciclo = f"{MODALIDAD_ABBR.get(str(fila_curso['MODALIDAD']).lower(), 'X')} {NIVEL_ABBR.get(nivel, 'X')}{ciclo}"
+    ws["G2"] = modalidad_nivel_ciclo
+    ws["H2"] = pd.to_datetime(fila_curso["F. Inicio"])
+    ws["I2"] = pd.to_datetime(fila_curso["F. Fin"])
+    ws["H2"].number_format = 'DD-MMM'
+    ws["I2"].number_format = 'DD-MMM'
+
+    # Poner feriados debajo de "Feriados" en G4 para abajo
+    ws["G4"] = "Feriados"
+    for i, f in enumerate(feriados):
+        ws.cell(row=5+i, column=7).value = f
+
+def nombres_archivo_cursos(df_curso):
+    # Nombre de archivo (sin extensión) para cada CODIGO del DataFrame limpio. Si dos cursos
+    # generan el mismo nombre corto, ambos llevan el código al final: el resultado no depende
+    # del orden de exportación ni de qué proceso exporte primero.
+    from salida_atomica import desambiguar_nombres
+
+    nombres = {
+        fila["CODIGO"]: nombre_corto_fila(fila).replace("/", "-")
+        for fila in df_curso.to_dict("records")
+    }
+    return desambiguar_nombres(nombres)
+
+def ruta_inscritos(carpeta_entrada, codigo_curso, archivos_inscritos=None):
+    # archivos_inscritos: {CODIGO: Path}, p. ej. dict(archivos_emparejados(tabla)), para leer el
+    # archivo resuelto (Inscritos_025060001.xlsx, el más reciente de un duplicado...). Las claves
+    # pueden ser el valor de la hoja o el código normalizado.
+    if archivos_inscritos:
+        ruta = archivos_inscritos.get(codigo_curso)
+        if ruta is None:
+            ruta = archivos_inscritos.get(normalizar_codigo(codigo_curso))
+        if ruta is not None:
+            return ruta
+    return f"{carpeta_entrada}/Inscritos_{codigo_curso}.xlsx"
+
+def construir_libro_curso(
+    codigo_curso, df_curso, feriados, plantilla_path, carpeta_entrada="./", df_inscritos=None, archivos_inscritos=None
+):
+    # Libro en memoria (plantilla + inscritos) listo para guardarse donde se necesite
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    wb = load_workbook(plantilla_path)
+    if df_inscritos is None:
+        df_inscritos = pd.read_excel(ruta_inscritos(carpeta_entrada, codigo_curso, archivos_inscritos))
+    llenar_hoja_curso(wb.active, codigo_curso, df_curso, feriados, df_inscritos)
+    return wb
+
+def exportar_inscritos_formato_morado(
+    codigo_curso,
+    df_curso,
+    feriados,
+    plantilla_path="plantilla_lista_estudiantes.xlsx",
+    carpeta_entrada="./",
+    carpeta_salida="./",
+    df_inscritos=None,
+    nombres_archivo=None,
+    archivos_inscritos=None
+):
+    # plantilla_path puede ser una ruta o un buffer en memoria (p. ej. BytesIO con la plantilla
+    # ya leída) y df_inscritos permite pasar la lista de inscritos ya cargada. nombres_archivo
+    # es el resultado de nombres_archivo_cursos(df_curso), para no recalcularlo en cada curso.
+    # archivos_inscritos: ver ruta_inscritos.
+    from salida_atomica import guardar_atomico
+
+    if nombres_archivo is None:
+        nombres_archivo = nombres_archivo_cursos(df_curso)
+    nombre_salida = nombres_archivo.get(codigo_curso) or nombre_corto_curso(codigo_curso, df_curso).replace("/", "-")
+    output_dir = Path(carpeta_salida)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    ruta_destino = str(output_dir / (nombre_salida + ".xlsx"))
+
+    # Se abre la plantilla directamente y se guarda en destino (sin copiarla antes en disco).
+    # La escritura es atómica y con bloqueo: otros exportadores pueden compartir la carpeta.
+    wb = construir_libro_curso(
+        codigo_curso, df_curso, feriados, plantilla_path, carpeta_entrada, df_inscritos, archivos_inscritos
+    )
+    guardar_atomico(ruta_destino, wb.save)
+    print("✅ Exportado:", ruta_destino)
+    return ruta_destino
+
+def nombre_hoja(nombre, usados):
+    # Excel limita los nombres de hoja a 31 caracteres, sin []:*?/\ y únicos sin distinguir mayúsculas
+    base = re.sub(r"[\[\]:*?/\\]", "-", nombre)[:31]
+    titulo = base
+    n = 2
+    while titulo.upper() in usados:
+        sufijo = f" ({n})"
+        titulo = base[:31 - len(sufijo)] + sufijo
+        n += 1
+    usados.add(titulo.upper())
+    return titulo
+
+def titulo_hoja_curso(codigo_curso, df_curso, nombres_archivo=None):
+    # El código va primero para que sobreviva al recorte de 31 caracteres de Excel y cada hoja
+    # se pueda reconocer aunque dos secciones compartan docente, nivel y horario
+    if nombres_archivo is None:
+        nombres_archivo = nombres_archivo_cursos(df_curso)
+    nombre = nombres_archivo.get(codigo_curso) or nombre_corto_curso(codigo_curso, df_curso)
+    sufijo = f" ({codigo_curso})"
+    if nombre.endswith(sufijo):
+        nombre = nombre[:-len(sufijo)]
+    return f"{codigo_curso} {nombre}"
+
+def exportar_libro_multihoja(
+    codigos_cursos,
+    df_curso,
+    feriados,
+    plantilla_path="plantilla_lista_estudiantes.xlsx",
+    carpeta_entrada="./",
+    ruta_salida="./Listas.xlsx",
+    archivos_inscritos=None
+):
+    # Exporta todos los cursos en un solo libro, una hoja por curso. La plantilla se carga
+    # una sola vez, cada hoja es una copia en memoria de la hoja base (comparten la tabla
+    # de estilos del libro) y el archivo se guarda una única vez al final.
+    import pandas as pd
+    from openpyxl import load_workbook
+    from salida_atomica import guardar_atomico
+
+    Path(ruta_salida).parent.mkdir(parents=True, exist_ok=True)
+    wb = load_workbook(plantilla_path)
+    base = wb.active
+    nombres_archivo = nombres_archivo_cursos(df_curso)
+    usados = set()
+    agregadas = 0
+    for codigo_curso in codigos_cursos:
+        # Un curso con errores (p. ej. inscritos sin la columna CODIGO_CURSO) se informa y se
+        # omite, igual que en la exportación de un archivo por curso
+        ws = None
+        try:
+            df_inscritos = pd.read_excel(ruta_inscritos(carpeta_entrada, codigo_curso, archivos_inscritos))
+            ws = wb.copy_worksheet(base)
+            ws.title = nombre_hoja(titulo_hoja_curso(codigo_curso, df_curso, nombres_archivo), usados)
+            llenar_hoja_curso(ws, codigo_curso, df_curso, feriados, df_inscritos)
+        except Exception as e:
+            if ws is not None:
+                usados.discard(ws.title.upper())
+                wb.remove(ws)
+            print(f"❌ Error exportando el curso {codigo_curso}: {e}")
+            continue
+        agregadas += 1
+        print("✅ Hoja agregada:", ws.title)
+    if not agregadas:
+        print("❌ Ningún curso se pudo exportar; no se escribió", ruta_salida)
+        return None
+    wb.remove(base)
+    wb.active = 0
+    guardar_atomico(ruta_salida, wb.save)
+    print("✅ Exportado:", ruta_salida)
+    return str(ruta_salida)
+
+def carpeta_zip_curso(codigo_curso, df_curso):
+    # Carpeta dentro del .zip: IDIOMA/MODALIDAD (p. ej. ITALIANO/REG)
+    import pandas as pd
+
+    fila = df_curso[df_curso["CODIGO"] == codigo_curso].iloc[0]
+    idioma = str(fila["IDIOMA"]) if pd.notna(fila["IDIOMA"]) else "SIN IDIOMA"
+    modalidad = MODALIDAD_ABBR.get(str(fila["MODALIDAD"]).lower(), "X")
+    return f"{idioma}/{modalidad}"
+
+def exportar_zip_cursos(
+    codigos_cursos,
+    df_curso,
+    feriados,
+    plantilla_path="plantilla_lista_estudiantes.xlsx",
+    carpeta_entrada="./",
+    ruta_zip="./Listas.zip",
+    archivos_inscritos=None
+):
+    # Un .zip con un .xlsx por curso agrupado en carpetas IDIOMA/MODALIDAD. Cada libro se
+    # serializa directamente dentro de su entrada del zip: no se escriben archivos temporales.
+    # Los .xlsx ya vienen comprimidos, por eso las entradas se guardan sin volver a comprimir.
+    import zipfile
+    from salida_atomica import bloqueo_archivo, escritura_atomica
+
+    Path(ruta_zip).parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(plantilla_path, (str, Path)):
+        plantilla = Path(plantilla_path).read_bytes()
+    else:
+        plantilla = plantilla_path.read()
+    nombres_archivo = nombres_archivo_cursos(df_curso)
+    entradas = []
+    with bloqueo_archivo(ruta_zip), escritura_atomica(ruta_zip) as archivo_zip:
+        with zipfile.ZipFile(archivo_zip, "w", compression=zipfile.ZIP_STORED) as zf:
+            for codigo_curso in codigos_cursos:
+                # Los errores de un curso (inscritos ilegibles, curso inexistente...) aparecen al
+                # armar el libro, antes de abrir su entrada: se informan y el curso se omite
+                try:
+                    wb = construir_libro_curso(
+                        codigo_curso, df_curso, feriados, io.BytesIO(plantilla), carpeta_entrada,
+                        archivos_inscritos=archivos_inscritos,
+                    )
+                    nombre = nombres_archivo.get(codigo_curso) or nombre_corto_curso(codigo_curso, df_curso).replace("/", "-")
+                    entrada = f"{carpeta_zip_curso(codigo_curso, df_curso)}/{nombre}.xlsx"
+                except Exception as e:
+                    print(f"❌ Error exportando el curso {codigo_curso}: {e}")
+                    continue
+                with zf.open(entrada, "w") as destino:
+                    wb.save(destino)
+                entradas.append(entrada)
+                print("✅ Agregado al zip:", entrada)
+            if not entradas:
+                # Sin entradas no se reemplaza un .zip anterior por uno vacío
+                raise ValueError("Ningún curso se pudo exportar")
+    print("✅ Exportado:", ruta_zip)
+    return entradas
+
+def normalizar_codigo(valor):
+    # Forma única de un código de curso, venga del Excel (25060001, 25060001.0) o del nombre
+    # de archivo ("25060001", "025060001"): texto sin espacios ni ceros a la izquierda.
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)
+    texto = str(valor).strip().upper()
+    if texto.endswith(".0") and texto[:-2].isdigit():
+        texto = texto[:-2]
+    if texto.isdigit():
+        texto = str(int(texto))
+    return texto
+
+def codigo_de_archivo(nombre):
+    # Inscritos_<CODIGO>.xlsx -> CODIGO normalizado (igual que f.stem.split("_")[-1])
+    return normalizar_codigo(Path(nombre).stem.split("_")[-1])
+
+def resolver_inscritos(carpeta_inscritos, df_cursos):
+    # Tabla de archivos Inscritos_*.xlsx de la carpeta (una sola pasada con os.scandir)
+    # cruzada con los códigos del DataFrame limpio. Columnas: CODIGO (normalizado), ARCHIVO
+    # (Path), MTIME, ESTADO ("emparejado", "sin curso" o "duplicado": otro archivo del mismo
+    # código; se empareja el más reciente) y CODIGO_HOJA, el valor de CODIGO tal como está en
+    # df_cursos (25060001 o "25060001"), que es el que reciben los exportadores.
+    import os
+    import pandas as pd
+
+    carpeta = Path(carpeta_inscritos)
+    columnas = ["CODIGO", "ARCHIVO", "MTIME", "ESTADO", "CODIGO_HOJA"]
+    if not carpeta.exists():
+        return pd.DataFrame(columns=columnas)
+    entradas = [
+        (entrada.name, entrada.stat().st_mtime)
+        for entrada in os.scandir(carpeta)
+        if entrada.name.startswith("Inscritos_") and entrada.name.endswith(".xlsx") and entrada.is_file()
+    ]
+    if not entradas:
+        return pd.DataFrame(columns=columnas)
+
+    tabla = pd.DataFrame(entradas, columns=["NOMBRE", "MTIME"])
+    tabla["CODIGO"] = tabla["NOMBRE"].map(codigo_de_archivo)
+    # Normalizado -> valor de la hoja (el primero si dos filas comparten código)
+    codigos_hoja = pd.Series(list(df_cursos["CODIGO"]), index=df_cursos["CODIGO"].map(normalizar_codigo), dtype=object)
+    codigos_hoja = codigos_hoja[~codigos_hoja.index.duplicated(keep="first")]
+    tabla["CODIGO_HOJA"] = tabla["CODIGO"].map(codigos_hoja)
+    tabla["ESTADO"] = "sin curso"
+    tabla.loc[tabla["CODIGO"].isin(codigos_hoja.index), "ESTADO"] = "emparejado"
+
+    # Entre archivos del mismo código gana el más reciente (y a igual fecha, el primero por nombre)
+    tabla = tabla.sort_values(["CODIGO", "MTIME", "NOMBRE"], ascending=[True, False, True])
+    repetido = (tabla["ESTADO"] == "emparejado") & tabla.duplicated("CODIGO", keep="first")
+    tabla.loc[repetido, "ESTADO"] = "duplicado"
+    tabla["ARCHIVO"] = [carpeta / nombre for nombre in tabla["NOMBRE"]]
+    return tabla.sort_values("NOMBRE")[columnas].reset_index(drop=True)
+
+def archivos_emparejados(tabla):
+    # Lista (codigo, Path) de los archivos emparejados; codigo es el valor de la hoja
+    # (CODIGO_HOJA), listo para pasarlo tal cual a los exportadores
+    emparejados = tabla[tabla["ESTADO"] == "emparejado"]
+    return list(zip(emparejados["CODIGO_HOJA"], emparejados["ARCHIVO"]))
+
+def crear_carpeta_salida():
+    output_dir = Path("./output")
+    if not output_dir.exists():
+        output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+def crear_carpeta_inscritos():
+    inscritos_dir = Path("./inscritos")
+    if not inscritos_dir.exists():
+        inscritos_dir.mkdir(parents=True, exist_ok=True)
+    return inscritos_dir
+
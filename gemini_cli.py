@@ -1,17 +1,23 @@
-from google import genai
 import os
-from dotenv import load_dotenv
-load_dotenv()
 
-api_key = os.getenv("GEMINI_API_KEY")
-client = genai.Client(api_key=api_key)
+MODELO = "gemini-2.5-flash"
 
-from google import genai
+_client = None
 
-# The client gets the API key from the environment variable `GEMINI_API_KEY`.
-client = genai.Client()
+def obtener_cliente():
+    # El cliente (y las librerías de red) se crean recién en el primer uso, no al importar
+    global _client
+    if _client is None:
+        from google import genai
+        from dotenv import load_dotenv
+        load_dotenv()
+        # Si GEMINI_API_KEY no está definida, genai.Client la busca en el entorno igualmente
+        _client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+    return _client
 
-response = client.models.generate_content(
-    model="gemini-2.5-flash", contents="Write a description of a cat in 2000 words"
-)
-print(response.text)
\ No newline at end of file
+def generar(contenido, modelo=MODELO):
+    response = obtener_cliente().models.generate_content(model=modelo, contents=contenido)
+    return response.text
+
+if __name__ == "__main__":
+    print(generar("Write a description of a cat in 2000 words"))
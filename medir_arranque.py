@@ -0,0 +1,44 @@
+import re
+import subprocess
+import sys
+
+# Mide el costo de importación de cada script con `python -X importtime`.
+# Uso: python medir_arranque.py [modulo ...]
+MODULOS = ["menu_exportador", "exportador_core", "scrap_horarios_menu", "gemini_cli"]
+PESADOS = ["pandas", "openpyxl", "numpy", "InquirerPy", "google"]
+
+LINEA_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+def medir_importacion(modulo):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        return None, {}
+    acumulado = {}
+    total = 0
+    for linea in proc.stderr.splitlines():
+        m = LINEA_IMPORTTIME.match(linea)
+        if not m:
+            continue
+        nombre = m.group(4)
+        acumulado_us = int(m.group(2))
+        # Solo los imports de primer nivel suman al total (los anidados ya están incluidos)
+        if len(m.group(3)) == 1:
+            total += acumulado_us
+        if nombre in PESADOS:
+            acumulado[nombre] = acumulado_us
+    return total, acumulado
+
+def main(modulos):
+    for modulo in modulos:
+        total, pesados = medir_importacion(modulo)
+        if total is None:
+            print(f"❌ {modulo}: no se pudo importar")
+            continue
+        detalle = ", ".join(f"{k} {v / 1000:.0f} ms" for k, v in pesados.items()) or "sin dependencias pesadas"
+        print(f"{modulo}: {total / 1000:.1f} ms ({detalle})")
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or MODULOS)
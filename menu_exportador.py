@@ -1,58 +1,17 @@
-import re
-import pandas as pd
-from datetime import datetime, time
-from openpyxl import load_workbook
-from copy import copy
-from pathlib import Path
-import shutil
 import os
-import json
+from pathlib import Path
 from InquirerPy import inquirer
-from InquirerPy.separator import Separator
-
-# ========== CONFIGURACIÓN ==========
-
-CONFIG_FILE = "exportador_inscritos.config.json"
-
-IDIOMAS_VALIDOS = ["INGLÉS", "PORTUGUÉS", "ITALIANO", "QUECHUA"]
-
-IDIOMA_ABBR = {
-    "INGLÉS": "ING",
-    "PORTUGUÉS": "PORT",
-    "ITALIANO": "ITA",
-    "QUECHUA": "QUE"
-}
-NIVEL_ABBR = {
-    "Básico": "B",
-    "Intermedio": "I",
-    "Avanzado": "A"
-}
-MODALIDAD_ABBR = {
-    "regular": "REG",
-    "intensivo": "INT",
-    "súperintensivo": "SINT",
-    "superintensivo": "SINT",
-    "repaso": "REP"
-}
-DIA_COD = {0: "L", 1: "M", 2: "X", 3: "J", 4: "V", 5: "S", 6: "D"}
 
-COLUMNAS_FINALES = [
-    "CODIGO", "Nivel", "Ciclo", "MODALIDAD", "DOCENTE", "IDIOMA", "DÍAS DETECTADOS",
-    "HORARIO DETALLADO", "F. Inicio", "F. Fin", "Parcial", "Final", "Subida de notas",
-    "N° Inscritos", "N° Esperado", "N° Aprobados", "N° Desaprobados",
-    "N° No asistio (tiene 0)", "Destalle del curso"
-]
-
-
-def cargar_config():
-    if Path(CONFIG_FILE).exists():
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
-
-def guardar_config(config):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, ensure_ascii=False, indent=4)
+# El núcleo de limpieza/exportación vive en exportador_core (importa pandas y openpyxl
+# de forma diferida). Los nombres públicos que antes se definían aquí se siguen re-exportando
+# para los scripts que los importaban desde este módulo; el resto es lo que usa el menú.
+from exportador_core import (
+    CONFIG_FILE, IDIOMAS_VALIDOS, IDIOMA_ABBR, NIVEL_ABBR, MODALIDAD_ABBR, DIA_COD, COLUMNAS_FINALES,
+    cargar_config, guardar_config, clean_df_mes_idioma, nombre_corto_curso,
+    exportar_inscritos_formato_morado, crear_carpeta_salida, crear_carpeta_inscritos,
+    DIAS_VALIDOS, nombre_corto_fila, nombres_archivo_cursos, exportar_libro_multihoja, exportar_zip_cursos,
+    resolver_inscritos, archivos_emparejados, normalizar_codigo,
+)
 
 def limpiar_consola():
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -60,243 +19,6 @@ def limpiar_consola():
 def pausar():
     input("\nPresiona ENTER para continuar...")
 
-# ========== PARTE DE LIMPIEZA Y TRANSFORMACIÓN ==========
-
-def clean_df_mes_idioma(excel_path, mes):
-    # Lee todos los cursos (de todos los idiomas) del mes seleccionado
-    df = pd.read_excel(excel_path, sheet_name=mes, skiprows=1)
-    matricula_idx = df[df.iloc[:, 0].astype(str).str.upper().str.contains("MATRÍCULA")].index
-    if not matricula_idx.empty:
-        df = df.loc[:matricula_idx[0] - 1]
-
-    df["IDIOMA"] = None
-    idioma_actual = "INGLÉS"
-    for i, row in df.iterrows():
-        cod_val = str(row.get("CODIGO", "")).strip().upper()
-        ciclo_val = str(row.get("CICLO", "")).strip().upper()
-        for idioma in IDIOMAS_VALIDOS[1:]:
-            if idioma in cod_val or idioma in ciclo_val:
-                idioma_actual = idioma
-                break
-        df.at[i, "IDIOMA"] = idioma_actual
-    df["IDIOMA"] = df["IDIOMA"].ffill()
-    df = df[df["CODIGO"].notna()]
-    df = df[~df["CODIGO"].astype(str).str.upper().isin(IDIOMAS_VALIDOS)]
-    df = df[~df["CODIGO"].astype(str).str.upper().str.contains("CODIGO")]
-    df["DOCENTE"] = df["DOCENTE"].ffill()
-
-    # Nivel y Ciclo
-    def extraer_nivel_y_ciclo(valor):
-        valor = str(valor).strip().upper()
-        if "REPASO" in valor:
-            return "", "", "repaso"
-        match = re.match(r"([BIA])(\d+)", valor)
-        if match:
-            nivel_map = {"B": "Básico", "I": "Intermedio", "A": "Avanzado"}
-            return nivel_map.get(match.group(1), ""), match.group(2), None
-        return "", "", None
-
-    niveles = []
-    ciclos = []
-    overrides = []
-    for valor in df.get("CICLO", []):
-        try:
-            result = extraer_nivel_y_ciclo(valor)
-            if not isinstance(result, (list, tuple)) or len(result) != 3:
-                result = ("", "", None)
-        except Exception:
-            result = ("", "", None)
-        nivel, ciclo, override = result
-        niveles.append(nivel)
-        ciclos.append(ciclo)
-        overrides.append(override)
-    df["Nivel"] = niveles if niveles else None
-    df["Ciclo"] = ciclos if ciclos else None
-    df["_mod_override"] = overrides if overrides else None
-
-    if "_mod_override" in df.columns and "MODALIDAD" in df.columns:
-        df["MODALIDAD"] = df.apply(
-            lambda row: row["_mod_override"] if pd.notna(row.get("_mod_override")) else row.get("MODALIDAD"),
-            axis=1
-        )
-        df.drop(columns=["_mod_override"], inplace=True)
-
-    # Días detectados
-    def extraer_dias(texto):
-        if pd.isna(texto): return []
-        texto = texto.upper().replace(" Y ", ", ")
-        dias_validos = ["LUNES", "MARTES", "MIÉRCOLES", "JUEVES", "VIERNES", "SÁBADOS", "DOMINGOS"]
-        return [d for d in map(str.strip, texto.split(",")) if d in dias_validos]
-
-    df["DÍAS DETECTADOS"] = df["DIAS"].apply(extraer_dias)
-
-    # Inscritos y esperados
-    def separar_inscritos(val):
-        if pd.isna(val): return pd.Series([None, None])
-        val = str(val).strip()
-        if "/" in val:
-            try:
-                num, esperado = val.split("/")
-                return pd.Series([int(num), int(esperado)])
-            except:
-                return pd.Series([None, None])
-        elif val.isdigit():
-            return pd.Series([int(val), None])
-        return pd.Series([None, None])
-
-    if "Nª inscritos" in df.columns:
-        df[["N° Inscritos", "N° Esperado"]] = df["Nª inscritos"].apply(separar_inscritos)
-    else:
-        df["N° Inscritos"] = None
-        df["N° Esperado"] = None
-
-    # Horario detallado estructurado
-    dia_a_codigo = {
-        "LUNES": 0, "MARTES": 1, "MIÉRCOLES": 2,
-        "JUEVES": 3, "VIERNES": 4, "SÁBADOS": 5, "DOMINGOS": 6
-    }
-    def parse_hora(hora_str):
-        try:
-            return datetime.strptime(hora_str.strip(), "%H:%M").time()
-        except:
-            return None
-
-    def mapear_horarios_especial(dias, horas):
-        if not isinstance(horas, str) or not dias:
-            return {}
-        bloques = [h.strip() for h in horas.split(",")]
-        resultado = {}
-        if len(bloques) == 2 and len(dias) >= 3:
-            try:
-                h1_inicio, h1_fin = map(parse_hora, bloques[0].split(" - "))
-                h2_inicio, h2_fin = map(parse_hora, bloques[1].split(" - "))
-                resultado[dia_a_codigo[dias[0]]] = (h1_inicio, h1_fin)
-                for d in dias[1:]:
-                    resultado[dia_a_codigo[d]] = (h2_inicio, h2_fin)
-            except:
-                return {}
-        elif len(bloques) == 1:
-            try:
-                h_inicio, h_fin = map(parse_hora, bloques[0].split(" - "))
-                for d in dias:
-                    resultado[dia_a_codigo[d]] = (h_inicio, h_fin)
-            except:
-                return {}
-        return resultado
-
-    df["HORARIO DETALLADO"] = df.apply(lambda row: mapear_horarios_especial(row["DÍAS DETECTADOS"], row["HORAS"]), axis=1)
-
-    # Fechas como date (con formato seguro)
-    for col in ["F. Inicio", "F. Fin", "Parcial", "Final", "Subida de notas"]:
-        df[col] = pd.to_datetime(df[col], format="%Y-%m-%d", errors='coerce').dt.date
-
-    # Convertir columnas a enteros o nulo
-    columnas_enteras = [
-        "Ciclo", "N° Inscritos", "N° Esperado",
-        "N° Aprobados", "N° Desaprobados", "N° No asistio (tiene 0)"
-    ]
-    for col in columnas_enteras:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-
-    return df[COLUMNAS_FINALES].reset_index(drop=True)
-
-def nombre_corto_curso(codigo_curso, df):
-    fila = df[df["CODIGO"] == codigo_curso]
-    if fila.empty:
-        return f"❌ Código {codigo_curso} no encontrado."
-    fila = fila.iloc[0]
-    docente = str(fila["DOCENTE"]).strip()
-    idioma = IDIOMA_ABBR.get(str(fila["IDIOMA"]).upper(), str(fila["IDIOMA"])[:3].upper())
-    nivel = NIVEL_ABBR.get(fila["Nivel"], "NA")
-    ciclo = str(fila["Ciclo"]).zfill(2) if pd.notna(fila["Ciclo"]) else "00"
-    modalidad = MODALIDAD_ABBR.get(str(fila["MODALIDAD"]).lower(), "X")
-    dias_abbr = "".join([DIA_COD.get(dia, "?") for dia in sorted(fila["HORARIO DETALLADO"].keys())])
-    horas_unicas = sorted(set([
-        "-".join(f"{h.hour:02d}-{h.minute:02d}" for h in v if isinstance(h, time))
-        for v in fila["HORARIO DETALLADO"].values()
-        if isinstance(v, tuple) and all(isinstance(h, time) for h in v)
-    ]))
-    horario_final = "-".join(horas_unicas)
-    return f"{docente}-{idioma} {modalidad}{ciclo}({nivel})-{dias_abbr}-{horario_final}"
-
-def exportar_inscritos_formato_morado(
-    codigo_curso,
-    df_curso,
-    feriados,
-    plantilla_path="plantilla_lista_estudiantes.xlsx",
-    carpeta_entrada="./",
-    carpeta_salida="./"
-):
-    nombre_salida = nombre_corto_curso(codigo_curso, df_curso) + ".xlsx"
-    nombre_salida = nombre_salida.replace("/", "-")
-    output_dir = Path(carpeta_salida)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    ruta_destino = str(output_dir / nombre_salida)
-
-    shutil.copy(plantilla_path, ruta_destino)
-
-    wb = load_workbook(ruta_destino)
-    ws = wb.active
-    df_inscritos = pd.read_excel(f"{carpeta_entrada}/Inscritos_{codigo_curso}.xlsx")
-
-    n_estudiantes = df_inscritos.shape[0]
-
-    # Copiar formato de la fila 2 (A-E) hacia abajo para cada estudiante
-    for i in range(n_estudiantes):
-        source_row = 2
-        target_row = 2 + i
-        for col in range(1, 6):  # columnas A-E
-            cell_src = ws.cell(row=source_row, column=col)
-            cell_tgt = ws.cell(row=target_row, column=col)
-            cell_tgt._style = copy(cell_src._style)
-            cell_tgt.font = copy(cell_src.font)
-            cell_tgt.border = copy(cell_src.border)
-            cell_tgt.fill = copy(cell_src.fill)
-            cell_tgt.number_format = copy(cell_src.number_format)
-            cell_tgt.protection = copy(cell_src.protection)
-            cell_tgt.alignment = copy(cell_src.alignment)
-
-    # Llenar datos en las filas A3-E{n}
-    for idx, row in enumerate(df_inscritos.itertuples(index=False), start=2):
-        ws[f"A{idx}"] = idx - 1
-        ws[f"B{idx}"] = row.CODIGO_CURSO
-        ws[f"C{idx}"] = row.NOMBRES
-        ws[f"D{idx}"] = row.CORREO
-        ws[f"E{idx}"] = row.CELULAR
-
-    # Poner modalidad, nivel, ciclo en G2, fechas en H2 e I2
-    fila_curso = df_curso[df_curso["CODIGO"] == codigo_curso].iloc[0]
-    nivel = fila_curso["Nivel"]
-    ciclo = str(fila_curso["Ciclo"]).zfill(2) if pd.notna(fila_curso["Ciclo"]) else ""
-    modalidad_nivel_ciclo = f"{MODALIDAD_ABBR.get(str(fila_curso['MODALIDAD']).lower(), 'X')} {NIVEL_ABBR.get(nivel, 'X')}{ciclo}"
-    ws["G2"] = modalidad_nivel_ciclo
-    ws["H2"] = pd.to_datetime(fila_curso["F. Inicio"])
-    ws["I2"] = pd.to_datetime(fila_curso["F. Fin"])
-    ws["H2"].number_format = 'DD-MMM'
-    ws["I2"].number_format = 'DD-MMM'
-
-    # Poner feriados debajo de "Feriados" en G4 para abajo
-    ws["G4"] = "Feriados"
-    for i, f in enumerate(feriados):
-        ws.cell(row=5+i, column=7).value = f
-
-    wb.save(ruta_destino)
-    print("✅ Exportado:", ruta_destino)
-    return ruta_destino
-
-def crear_carpeta_salida():
-    output_dir = Path("./output")
-    if not output_dir.exists():
-        output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir
-
-def crear_carpeta_inscritos():
-    inscritos_dir = Path("./inscritos")
-    if not inscritos_dir.exists():
-        inscritos_dir.mkdir(parents=True, exist_ok=True)
-    return inscritos_dir
-
 # ========== INTERFAZ DE CONFIGURACIÓN ==========
 
 def seleccionar_plantilla(config):
@@ -332,6 +54,8 @@ def seleccionar_carga_horaria(config):
     return carga_horaria
 
 def seleccionar_mes(config, carga_horaria):
+    import pandas as pd
+
     limpiar_consola()
     xl = pd.ExcelFile(carga_horaria)
     opciones = [{"name": sh, "value": sh} for sh in xl.sheet_names]
@@ -352,30 +76,166 @@ def ingresar_feriados(config):
     guardar_config(config)
     return feriados
 
+def seleccionar_idioma(config):
+    limpiar_consola()
+    opciones = [{"name": "Todos los idiomas", "value": None}]
+    opciones += [{"name": idioma, "value": idioma} for idioma in IDIOMAS_VALIDOS]
+    idioma = inquirer.select(
+        message="Selecciona el idioma a procesar:",
+        choices=opciones,
+    ).execute()
+    config["idioma"] = idioma
+    guardar_config(config)
+    return idioma
+
 def mostrar_config(config):
     print("\n======= Configuración Actual =======")
     for k, v in config.items():
         print(f"{k}: {v}")
 
+def opciones_selector_cursos(archivos_validos, df_cursos):
+    # Etiquetas y grupos (idioma e idioma + modalidad) calculados una sola vez, recorriendo
+    # el DataFrame una vez en lugar de buscar cada código con nombre_corto_curso.
+    filas = {}
+    for fila in df_cursos.to_dict("records"):
+        filas.setdefault(normalizar_codigo(fila["CODIGO"]), fila)
+
+    opciones = []
+    grupos = {}
+    for cod, f in archivos_validos:
+        fila = filas.get(normalizar_codigo(cod))
+        if fila is None:
+            opciones.append({"name": f"❌ Código {cod} no encontrado. ({f.name})", "value": (cod, f)})
+            continue
+        idioma = str(fila["IDIOMA"])
+        modalidad = MODALIDAD_ABBR.get(str(fila["MODALIDAD"]).lower(), "X")
+        opciones.append({"name": f"{nombre_corto_fila(fila)} · {idioma} ({f.name})", "value": (cod, f)})
+        for clave in (idioma, f"{idioma} {modalidad}"):
+            grupos.setdefault(clave, []).append((cod, f))
+
+    opciones_grupo = [{"name": f"[TODOS] {len(archivos_validos)} cursos", "value": ("grupo", None)}]
+    opciones_grupo += [
+        {"name": f"[GRUPO] {clave} ({len(miembros)} cursos)", "value": ("grupo", clave)}
+        for clave, miembros in sorted(grupos.items())
+    ]
+    return opciones_grupo + opciones, grupos
+
 def seleccionar_varios_archivos(archivos_validos, df_cursos):
     if not archivos_validos:
         print("❌ No se encontraron archivos de inscritos coincidentes con los cursos.")
         pausar()
         return []
-    opciones = [
-        {"name": f"{nombre_corto_curso(int(cod), df_cursos)} ({f.name})", "value": (cod, f)}
-        for cod, f in archivos_validos
-    ]
-    opciones.append(Separator())
-    opciones.append({"name": "Seleccionar todos", "value": "all"})
-    seleccionados = inquirer.checkbox(
-        message="Selecciona los archivos a exportar (Espacio para marcar/desmarcar, ENTER para confirmar):",
+    opciones, grupos = opciones_selector_cursos(archivos_validos, df_cursos)
+    # El buscador difuso (pfzy) filtra por docente, idioma, nivel o código mientras se escribe
+    seleccionados = inquirer.fuzzy(
+        message="Selecciona los cursos a exportar (escribe para filtrar, TAB para marcar, ENTER para confirmar):",
         choices=opciones,
-        instruction="Usa ↑/↓ para navegar, espacio para marcar"
+        multiselect=True,
+        instruction="Ej.: 'ITALIANO REG', un docente o un código",
+        long_instruction="[GRUPO] marca todos los cursos del grupo; [TODOS] marca todos.",
+    ).execute()
+
+    elegidos = []
+    for valor in seleccionados:
+        if valor[0] == "grupo":
+            elegidos += archivos_validos if valor[1] is None else grupos[valor[1]]
+        else:
+            elegidos.append(valor)
+    # Sin duplicados y en el orden original
+    elegidos = set(elegidos)
+    return [par for par in archivos_validos if par in elegidos]
+
+def mostrar_resolucion(tabla_inscritos):
+    if tabla_inscritos.empty:
+        print("Archivos encontrados: Ninguno")
+        return
+    conteo = tabla_inscritos["ESTADO"].value_counts()
+    print(f"Archivos encontrados: {len(tabla_inscritos)} ({conteo.get('emparejado', 0)} con curso)")
+    for estado, mensaje in [("sin curso", "sin curso en el mes"), ("duplicado", "duplicados (se usa el más reciente)")]:
+        nombres = [f.name for f in tabla_inscritos.loc[tabla_inscritos["ESTADO"] == estado, "ARCHIVO"]]
+        if nombres:
+            print(f"⚠️ {len(nombres)} {mensaje}: {', '.join(nombres)}")
+
+def seleccionar_formato_salida():
+    return inquirer.select(
+        message="Formato de salida:",
+        choices=[
+            {"name": "Un archivo por curso", "value": "archivos"},
+            {"name": "Un solo libro con una hoja por curso", "value": "libro"},
+            {"name": "Un .zip con un archivo por curso (carpetas por idioma/modalidad)", "value": "zip"},
+        ],
+        default="archivos",
+    ).execute()
+
+def consultar_ocupacion(df_cursos):
+    from ocupacion_docentes import MatrizOcupacion
+
+    matriz = MatrizOcupacion(df_cursos)
+    consulta = inquirer.select(
+        message="¿Qué deseas consultar?",
+        choices=[
+            {"name": "Docentes libres en un horario", "value": "libres"},
+            {"name": "Horas semanales por docente", "value": "horas"},
+        ],
+    ).execute()
+    if consulta == "horas":
+        print(matriz.horas_semanales().to_string())
+        cruces = matriz.cruces()
+        if cruces:
+            print("\n⚠️ Docentes con cruce de horarios:", ", ".join(cruces))
+        return
+    dia = inquirer.select(message="Día:", choices=DIAS_VALIDOS).execute()
+    desde = inquirer.text(message="Desde (HH:MM):", default="19:00").execute()
+    hasta = inquirer.text(message="Hasta (HH:MM):", default="21:00").execute()
+    try:
+        libres = matriz.docentes_libres(dia, desde, hasta)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    print(f"\nDocentes libres el {dia.lower()} de {desde} a {hasta}:")
+    for docente in libres:
+        print(f"- {docente}")
+
+def comparar_versiones(config):
+    import pandas as pd
+    from diff_carga_horaria import (
+        comparar_archivos, imprimir_diff, codigos_a_reexportar, cursos_renombrados, reexportar_afectados,
+        salidas_obsoletas,
+    )
+
+    limpiar_consola()
+    archivos = [f for f in Path('.').glob("*.xlsx") if not str(f).startswith("~$")]
+    if not archivos:
+        # La opción 11 del menú ya hace pausar() al volver
+        print("❌ No se encontraron archivos .xlsx en la carpeta actual.")
+        return
+    ruta_antes = inquirer.select(
+        message="Selecciona la versión ANTERIOR de la carga horaria (.xlsx):",
+        choices=[{"name": f.name, "value": str(f)} for f in archivos],
+    ).execute()
+    mes_antes = inquirer.select(
+        message="Selecciona el mes (sheet) de la versión anterior:",
+        choices=pd.ExcelFile(ruta_antes).sheet_names,
     ).execute()
-    if "all" in seleccionados:
-        return archivos_validos
-    return seleccionados
+    print(f"Comparando {ruta_antes} [{mes_antes}] con {config['carga_horaria']} [{config['mes']}]...")
+    resumen, detalle, df_antes, df_cursos = comparar_archivos(ruta_antes, mes_antes, config["carga_horaria"], config["mes"])
+    imprimir_diff(resumen, detalle)
+    afectados = codigos_a_reexportar(resumen, cursos_renombrados(df_antes, df_cursos))
+    if not afectados:
+        return
+    if not inquirer.confirm(message=f"¿Exportar de nuevo los {len(afectados)} cursos afectados?", default=True).execute():
+        return
+    reexportar_afectados(resumen, df_cursos, config, carpeta_entrada="inscritos/", carpeta_salida="./output/",
+                         df_antes=df_antes)
+    obsoletos = salidas_obsoletas(df_antes, df_cursos, "./output/")
+    if not obsoletos:
+        return
+    print("⚠️ Salidas de cursos renombrados o eliminados:")
+    for ruta in obsoletos:
+        print(f"- {ruta.name}")
+    if inquirer.confirm(message=f"¿Borrar estos {len(obsoletos)} archivos?", default=False).execute():
+        for ruta in obsoletos:
+            ruta.unlink(missing_ok=True)
 
 # ========== MAIN CON MENÚ ==========
 def main():
@@ -394,6 +254,10 @@ def main():
                 {"name": "Cambiar plantilla", "value": "5"},
                 {"name": "Mostrar carga horaria y cursos", "value": "6"},
                 {"name": "Mostrar configuración actual", "value": "7"},
+                {"name": "Filtrar por idioma", "value": "8"},
+                {"name": "Vigilar inscritos/ y exportar automáticamente", "value": "9"},
+                {"name": "Consultar disponibilidad y horas de docentes", "value": "10"},
+                {"name": "Comparar con otra versión de la carga horaria", "value": "11"},
                 {"name": "Salir", "value": "0"},
             ],
             default="1",
@@ -410,7 +274,7 @@ def main():
                 continue
             limpiar_consola()
             print("Leyendo cursos...")
-            df_cursos = clean_df_mes_idioma(config["carga_horaria"], config["mes"])
+            df_cursos = clean_df_mes_idioma(config["carga_horaria"], config["mes"], idioma=config.get("idioma"))
             if df_cursos.empty:
                 print("❌ No se encontraron cursos para el mes/archivo seleccionado.")
                 pausar()
@@ -423,39 +287,58 @@ def main():
                 print("❌ La carpeta inscritos/ no existe.")
                 pausar()
                 continue
-            archivos_inscritos = list(inscritos_folder.glob("Inscritos_*.xlsx"))
-            print("Archivos encontrados:", ", ".join([f.name for f in archivos_inscritos]) if archivos_inscritos else "Ninguno")
-
-            codigos_cursos_str = set(str(c) for c in df_cursos["CODIGO"])
-            codigos_cursos_int = set()
-            try:
-                codigos_cursos_int = set(int(c) for c in df_cursos["CODIGO"])
-            except Exception:
-                pass
-
-            archivos_validos = []
-            for f in archivos_inscritos:
-                cod_match = f.stem.split("_")[-1]
-                if (cod_match in codigos_cursos_str) or (cod_match.isdigit() and int(cod_match) in codigos_cursos_int):
-                    archivos_validos.append((cod_match, f))
+            tabla_inscritos = resolver_inscritos(inscritos_folder, df_cursos)
+            mostrar_resolucion(tabla_inscritos)
+            archivos_validos = archivos_emparejados(tabla_inscritos)
 
             seleccionados = seleccionar_varios_archivos(archivos_validos, df_cursos)
             if not seleccionados:
                 continue
 
+            formato = seleccionar_formato_salida()
             feriados = config.get("feriados", [])
             print("Exportando los siguientes cursos:")
             for cod, f in seleccionados:
-                desc = nombre_corto_curso(int(cod), df_cursos)
+                desc = nombre_corto_curso(cod, df_cursos)
                 print(f"- {desc}")
 
+            if formato == "libro":
+                try:
+                    exportar_libro_multihoja(
+                        [cod for cod, f in seleccionados], df_cursos, feriados,
+                        plantilla_path=config["plantilla"],
+                        carpeta_entrada="inscritos/",
+                        ruta_salida=Path("./output") / f"Listas {config['mes']}.xlsx".replace("/", "-"),
+                        archivos_inscritos=dict(seleccionados)
+                    )
+                except Exception as e:
+                    print(f"❌ Error exportando el libro: {e}")
+                pausar()
+                continue
+            if formato == "zip":
+                try:
+                    exportar_zip_cursos(
+                        [cod for cod, f in seleccionados], df_cursos, feriados,
+                        plantilla_path=config["plantilla"],
+                        carpeta_entrada="inscritos/",
+                        ruta_zip=Path("./output") / f"Listas {config['mes']}.zip".replace("/", "-"),
+                        archivos_inscritos=dict(seleccionados)
+                    )
+                except Exception as e:
+                    print(f"❌ Error exportando el zip: {e}")
+                pausar()
+                continue
+
+            nombres_archivo = nombres_archivo_cursos(df_cursos)
             for cod, f in seleccionados:
                 try:
                     exportar_inscritos_formato_morado(
-                        int(cod), df_cursos, feriados,
+                        cod, df_cursos, feriados,
                         plantilla_path=config["plantilla"],
                         carpeta_entrada="inscritos/",
-                        carpeta_salida="./output/"
+                        carpeta_salida="./output/",
+                        nombres_archivo=nombres_archivo,
+                        archivos_inscritos=dict(seleccionados)
                     )
                 except Exception as e:
                     print(f"❌ Error exportando {f.name}: {e}")
@@ -479,7 +362,7 @@ def main():
                 continue
             limpiar_consola()
             print("Leyendo cursos...")
-            df_cursos = clean_df_mes_idioma(config["carga_horaria"], config["mes"])
+            df_cursos = clean_df_mes_idioma(config["carga_horaria"], config["mes"], idioma=config.get("idioma"))
             if df_cursos.empty:
                 print("❌ No se encontraron cursos para el mes/archivo seleccionado.")
                 pausar()
@@ -490,6 +373,38 @@ def main():
         elif op == "7":
             mostrar_config(config)
             pausar()
+        elif op == "8":
+            seleccionar_idioma(config)
+        elif op == "9":
+            if not all(k in config for k in ["plantilla", "carga_horaria", "mes"]):
+                print("⚠️ Configura primero plantilla, archivo de carga horaria y mes.")
+                pausar()
+                continue
+            from vigilar_inscritos import vigilar
+            limpiar_consola()
+            vigilar(config, carpeta_entrada="inscritos/", carpeta_salida="./output/")
+            pausar()
+        elif op == "10":
+            if not all(k in config for k in ["carga_horaria", "mes"]):
+                print("⚠️ Configura primero archivo de carga horaria y mes.")
+                pausar()
+                continue
+            limpiar_consola()
+            print("Leyendo cursos...")
+            df_cursos = clean_df_mes_idioma(config["carga_horaria"], config["mes"], idioma=config.get("idioma"))
+            if df_cursos.empty:
+                print("❌ No se encontraron cursos para el mes/archivo seleccionado.")
+                pausar()
+                continue
+            consultar_ocupacion(df_cursos)
+            pausar()
+        elif op == "11":
+            if not all(k in config for k in ["plantilla", "carga_horaria", "mes"]):
+                print("⚠️ Configura primero plantilla, archivo de carga horaria y mes.")
+                pausar()
+                continue
+            comparar_versiones(config)
+            pausar()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,117 @@
+from numbers import Integral
+from datetime import time
+
+from exportador_core import DIAS_VALIDOS
+
+# Matriz de ocupación docente × día × bloque de 15 minutos construida a partir de la
+# columna HORARIO DETALLADO del DataFrame limpio (clean_df_mes_idioma). Una vez construida,
+# las consultas son operaciones de NumPy sobre la matriz, sin recorrer la carga horaria.
+#
+#   matriz = MatrizOcupacion(df_cursos)
+#   matriz.docentes_libres("MARTES", "19:00", "21:00")
+#   matriz.horas_semanales()
+
+MINUTOS_BLOQUE = 15
+BLOQUES_DIA = 24 * 60 // MINUTOS_BLOQUE
+SIN_DOCENTE = "SIN DOCENTE"
+
+
+def _indice_dia(dia):
+    # Acepta 0-6 (como las claves de HORARIO DETALLADO, también enteros de NumPy) o el nombre
+    # del día ("martes", "SÁBADOS")
+    if isinstance(dia, Integral) and not isinstance(dia, bool):
+        if 0 <= dia < len(DIAS_VALIDOS):
+            return int(dia)
+        raise ValueError(f"Día fuera de rango (0-6): {dia}")
+    if not isinstance(dia, str):
+        raise ValueError(f"Día no reconocido: {dia}")
+    nombre = str(dia).strip().upper()
+    for i, valido in enumerate(DIAS_VALIDOS):
+        if valido == nombre or valido.rstrip("S") == nombre:
+            return i
+    raise ValueError(f"Día no reconocido: {dia}")
+
+
+def _minutos(hora):
+    if isinstance(hora, time):
+        return hora.hour * 60 + hora.minute
+    try:
+        h, m = str(hora).strip().split(":")
+        h, m = int(h), int(m)
+    except ValueError:
+        raise ValueError(f"Hora inválida: {hora} (usa HH:MM)") from None
+    minutos = h * 60 + m
+    if h < 0 or not 0 <= m < 60 or not 0 <= minutos <= 24 * 60:
+        raise ValueError(f"Hora fuera del día: {hora} (00:00-24:00)")
+    return minutos
+
+
+def _bloque_inicio(hora):
+    return _minutos(hora) // MINUTOS_BLOQUE
+
+
+def _bloque_fin(hora):
+    # El fin se redondea hacia arriba: 09:10 ocupa el bloque 09:00-09:15
+    return -(-_minutos(hora) // MINUTOS_BLOQUE)
+
+
+class MatrizOcupacion:
+    def __init__(self, df_cursos):
+        import numpy as np
+        import pandas as pd
+
+        docentes = df_cursos["DOCENTE"].astype(object).where(df_cursos["DOCENTE"].notna(), SIN_DOCENTE)
+        docentes = docentes.astype(str).str.strip()
+        self.docentes = np.array(sorted(docentes.unique()), dtype=object)
+        codigo_docente = pd.Index(self.docentes).get_indexer(docentes)
+
+        # Aplanar los dict {dia: (inicio, fin)} en arreglos de bloques
+        filas, dias, inicios, fines = [], [], [], []
+        for fila, horario in enumerate(df_cursos["HORARIO DETALLADO"]):
+            if not isinstance(horario, dict):
+                continue
+            for dia, rango in horario.items():
+                if isinstance(rango, tuple) and len(rango) == 2 and all(isinstance(h, time) for h in rango):
+                    filas.append(fila)
+                    dias.append(dia)
+                    inicios.append(_bloque_inicio(rango[0]))
+                    fines.append(_bloque_fin(rango[1]))
+
+        # Una sola pasada vectorizada: cada bloque horario se vuelve una máscara sobre los
+        # 96 bloques del día y se acumula en (docente, día). La matriz cuenta cursos, así que
+        # un valor > 1 indica cruce de horarios del mismo docente.
+        self.conteo = np.zeros((len(self.docentes), 7, BLOQUES_DIA), dtype=np.uint8)
+        if filas:
+            bloques = np.arange(BLOQUES_DIA)
+            inicios = np.array(inicios)[:, None]
+            fines = np.array(fines)[:, None]
+            mascaras = ((bloques >= inicios) & (bloques < fines)).astype(np.uint8)
+            np.add.at(self.conteo, (codigo_docente[np.array(filas)], np.array(dias)), mascaras)
+        self.ocupado = self.conteo > 0
+        # SIN_DOCENTE agrupa los cursos sin docente asignado: no es una persona que pueda
+        # estar libre, ocupada o con cruces
+        self.es_docente = self.docentes != SIN_DOCENTE
+
+    def _rango(self, dia, desde, hasta):
+        if _minutos(hasta) <= _minutos(desde):
+            raise ValueError(f"El rango {desde}-{hasta} está vacío o invertido")
+        return _indice_dia(dia), _bloque_inicio(desde), _bloque_fin(hasta)
+
+    def docentes_libres(self, dia, desde, hasta):
+        d, a, b = self._rango(dia, desde, hasta)
+        return list(self.docentes[~self.ocupado[:, d, a:b].any(axis=1) & self.es_docente])
+
+    def docentes_ocupados(self, dia, desde, hasta):
+        d, a, b = self._rango(dia, desde, hasta)
+        return list(self.docentes[self.ocupado[:, d, a:b].any(axis=1) & self.es_docente])
+
+    def horas_semanales(self):
+        # Horas de clase por semana de cada docente (suma de todos sus cursos)
+        import pandas as pd
+
+        horas = self.conteo.sum(axis=(1, 2), dtype="int64") * MINUTOS_BLOQUE / 60
+        return pd.Series(horas, index=self.docentes, name="Horas semanales").sort_values(ascending=False)
+
+    def cruces(self):
+        # Docentes con dos o más cursos en el mismo bloque
+        return list(self.docentes[(self.conteo > 1).any(axis=(1, 2)) & self.es_docente])
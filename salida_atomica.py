@@ -0,0 +1,118 @@
+import os
+import time
+import secrets
+import contextlib
+from pathlib import Path
+from collections import Counter
+
+# Capa de escritura para las salidas del exportador: cada archivo se escribe en un temporal
+# de la misma carpeta y se renombra al final (nunca queda un .xlsx a medio escribir), y un
+# archivo <destino>.lock evita que dos exportadores escriban el mismo destino a la vez.
+
+ESPERA_BLOQUEO = 60       # segundos que se espera a que otro proceso libere un destino
+CADUCIDAD_BLOQUEO = 300   # un .lock más viejo que esto se considera abandonado (proceso caído)
+
+
+def _romper_bloqueo_caducado(ruta_bloqueo, caducidad):
+    # Devuelve True si el .lock estaba abandonado y se eliminó. Antes de borrarlo se renombra
+    # a un nombre único: si dos procesos lo ven caducado, solo uno logra el rename, y el otro
+    # nunca borra un .lock recién creado por el primero.
+    try:
+        st = os.stat(ruta_bloqueo)
+    except FileNotFoundError:
+        return True
+    if time.time() - st.st_mtime <= caducidad:
+        return False
+    apartado = f"{ruta_bloqueo}.{os.getpid()}.{time.monotonic_ns()}.caducado"
+    try:
+        os.rename(ruta_bloqueo, apartado)
+    except FileNotFoundError:
+        return True  # otro proceso ya lo rompió
+    st_apartado = os.stat(apartado)
+    if (st_apartado.st_ino, st_apartado.st_mtime_ns) != (st.st_ino, st.st_mtime_ns):
+        # Entre el stat y el rename otro proceso creó un .lock vigente: se devuelve a su lugar
+        # (link falla si ya existe otro, así nunca se pisa un bloqueo ajeno)
+        with contextlib.suppress(FileExistsError):
+            os.link(apartado, ruta_bloqueo)
+        os.remove(apartado)
+        return False
+    os.remove(apartado)
+    return True
+
+
+@contextlib.contextmanager
+def bloqueo_archivo(ruta, espera=ESPERA_BLOQUEO, caducidad=CADUCIDAD_BLOQUEO):
+    ruta_bloqueo = f"{ruta}.lock"
+    limite = time.monotonic() + espera
+    while True:
+        try:
+            # O_EXCL hace la creación atómica también entre procesos (y en Windows)
+            fd = os.open(ruta_bloqueo, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            break
+        except FileExistsError:
+            if _romper_bloqueo_caducado(ruta_bloqueo, caducidad):
+                continue
+            if time.monotonic() >= limite:
+                raise TimeoutError(f"{ruta} está siendo escrito por otro exportador ({ruta_bloqueo})")
+            time.sleep(0.05)
+    inodo = os.fstat(fd).st_ino
+    try:
+        os.write(fd, f"{os.getpid()}\n".encode())
+        os.close(fd)
+        yield
+    finally:
+        # Solo se borra el .lock propio (otro proceso pudo haberlo roto por caducado y creado el suyo)
+        with contextlib.suppress(FileNotFoundError):
+            if os.stat(ruta_bloqueo).st_ino == inodo:
+                os.remove(ruta_bloqueo)
+
+
+def _crear_temporal(carpeta):
+    # Como mkstemp, pero con modo 0666: mkstemp crea el archivo 0600 y, tras el rename, la
+    # salida no sería legible para otros usuarios de la carpeta compartida. Con 0666 se aplica
+    # la umask del proceso, igual que a cualquier archivo creado normalmente.
+    while True:
+        temporal = str(carpeta / f".~{os.getpid()}-{secrets.token_hex(6)}.tmp")
+        try:
+            fd = os.open(temporal, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0), 0o666)
+        except FileExistsError:
+            continue
+        return fd, temporal
+
+
+@contextlib.contextmanager
+def escritura_atomica(ruta):
+    # Entrega un archivo binario temporal; si el bloque termina sin errores reemplaza `ruta`
+    carpeta = Path(ruta).parent
+    carpeta.mkdir(parents=True, exist_ok=True)
+    fd, temporal = _crear_temporal(carpeta)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # Se conservan los permisos del archivo reemplazado; uno nuevo queda con los de la umask
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(temporal, os.stat(ruta).st_mode & 0o7777)
+        os.replace(temporal, ruta)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temporal)
+        raise
+
+
+def guardar_atomico(ruta, guardar):
+    # guardar recibe un archivo binario abierto (p. ej. Workbook.save)
+    with bloqueo_archivo(ruta), escritura_atomica(ruta) as f:
+        guardar(f)
+    return str(ruta)
+
+
+def desambiguar_nombres(nombres):
+    # {clave: nombre} -> {clave: nombre único}. Los nombres repetidos (sin distinguir
+    # mayúsculas, como en Windows) llevan la clave al final, p. ej. "ROSA-ITA REG01(B)-... (25060012)".
+    conteo = Counter(nombre.casefold() for nombre in nombres.values())
+    return {
+        clave: nombre if conteo[nombre.casefold()] == 1 else f"{nombre} ({clave})"
+        for clave, nombre in nombres.items()
+    }
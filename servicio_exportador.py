@@ -0,0 +1,254 @@
+import io
+import os
+import sys
+import json
+import argparse
+import threading
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from exportador_core import (
+    cargar_config, clean_df_mes_idioma, filtrar_cursos, nombre_corto_fila,
+    redactar_instrucciones, exportar_inscritos_formato_morado, resolver_inscritos,
+    archivos_emparejados, normalizar_codigo, nombres_archivo_cursos,
+)
+
+# Servicio local que mantiene en memoria la carga horaria limpia, la plantilla y las
+# listas de inscritos. Cada petición revisa (con un stat) si los archivos cambiaron
+# y solo recarga lo que haya cambiado.
+#
+# Uso: python servicio_exportador.py [--host 127.0.0.1] [--puerto 8765]
+#
+#   GET  /estado                              -> archivos cargados y tamaño de los cachés
+#   GET  /cursos?idioma=&modalidad=&docente=  -> cursos del mes con su nombre corto
+#   GET  /inscritos                           -> archivos de inscritos y su estado (emparejado, sin curso, duplicado)
+#   GET  /prompt?idioma=                      -> instrucciones de horarios para el asistente
+#   POST /exportar  {"codigos": [...]}        -> exporta los cursos indicados (o todos si se omite)
+
+HOST_POR_DEFECTO = "127.0.0.1"
+PUERTO_POR_DEFECTO = 8765
+
+
+def _valor_json(valor):
+    # NaN no es JSON válido: los vacíos del Excel se devuelven como null
+    import pandas as pd
+
+    return None if pd.isna(valor) else valor
+
+
+def _firma(ruta):
+    # Identifica una versión de un archivo sin leerlo
+    st = os.stat(ruta)
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ServicioExportador:
+    def __init__(self, config, carpeta_inscritos="inscritos/", carpeta_salida="./output/"):
+        self.config = config
+        self.carpeta_inscritos = Path(carpeta_inscritos)
+        self.carpeta_salida = Path(carpeta_salida)
+        self._lock = threading.RLock()
+        self._cursos = None
+        self._firma_cursos = None
+        self._nombres = {}          # CODIGO -> nombre corto, calculado al recargar los cursos
+        self._nombres_archivo = {}  # CODIGO -> nombre de archivo (nombres_archivo_cursos)
+        self._plantilla = None
+        self._firma_plantilla = None
+        self._inscritos = {}  # ruta -> (firma, DataFrame)
+
+    def cursos(self):
+        with self._lock:
+            ruta = self.config["carga_horaria"]
+            firma = (_firma(ruta), self.config["mes"])
+            if firma != self._firma_cursos:
+                self._cursos = clean_df_mes_idioma(ruta, self.config["mes"])
+                # Nombres en una sola pasada: nombre_corto_curso por fila recorrería todo el DataFrame
+                self._nombres = {fila["CODIGO"]: nombre_corto_fila(fila) for fila in self._cursos.to_dict("records")}
+                self._nombres_archivo = nombres_archivo_cursos(self._cursos)
+                self._firma_cursos = firma
+            return self._cursos
+
+    def nombres(self):
+        with self._lock:
+            self.cursos()
+            return self._nombres, self._nombres_archivo
+
+    def plantilla(self):
+        with self._lock:
+            ruta = self.config["plantilla"]
+            firma = _firma(ruta)
+            if firma != self._firma_plantilla:
+                self._plantilla = Path(ruta).read_bytes()
+                self._firma_plantilla = firma
+            return self._plantilla
+
+    def tabla_inscritos(self):
+        return resolver_inscritos(self.carpeta_inscritos, self.cursos())
+
+    def indice_inscritos(self):
+        return archivos_emparejados(self.tabla_inscritos())
+
+    def inscritos(self, ruta):
+        import pandas as pd
+
+        with self._lock:
+            firma = _firma(ruta)
+            cacheado = self._inscritos.get(str(ruta))
+            if cacheado is None or cacheado[0] != firma:
+                cacheado = (firma, pd.read_excel(ruta))
+                self._inscritos[str(ruta)] = cacheado
+            return cacheado[1]
+
+    def listar_cursos(self, idioma=None, modalidad=None, docente=None):
+        df = filtrar_cursos(self.cursos(), idioma, modalidad, docente)
+        nombres, _ = self.nombres()
+        return [
+            {
+                "codigo": str(fila["CODIGO"]),
+                "nombre": nombres.get(fila["CODIGO"]) or nombre_corto_fila(fila),
+                "idioma": _valor_json(fila["IDIOMA"]),
+                "modalidad": _valor_json(fila["MODALIDAD"]),
+                "docente": _valor_json(fila["DOCENTE"]),
+            }
+            for fila in df.to_dict("records")
+        ]
+
+    def listar_inscritos(self):
+        tabla = self.tabla_inscritos()
+        return [
+            {"codigo": cod, "archivo": f.name, "estado": estado}
+            for cod, f, estado in zip(tabla["CODIGO"], tabla["ARCHIVO"], tabla["ESTADO"])
+        ]
+
+    def prompt(self, idioma=None):
+        return redactar_instrucciones(filtrar_cursos(self.cursos(), idioma))
+
+    def exportar(self, codigos=None):
+        df_cursos = self.cursos()
+        _, nombres_archivo = self.nombres()
+        plantilla = self.plantilla()
+        archivos_validos = self.indice_inscritos()
+        exportados, errores = [], []
+        if codigos is not None:
+            pedidos = {normalizar_codigo(c) for c in codigos}
+            archivos_validos = [(cod, f) for cod, f in archivos_validos if normalizar_codigo(cod) in pedidos]
+            # Los códigos pedidos que no se pueden exportar se informan en vez de omitirse
+            codigos_cursos = set(df_cursos["CODIGO"].map(normalizar_codigo))
+            for cod in sorted(pedidos - {normalizar_codigo(cod) for cod, _ in archivos_validos}):
+                motivo = "sin archivo de inscritos" if cod in codigos_cursos else "no existe en la carga horaria del mes"
+                errores.append({"codigo": cod, "error": motivo})
+        for cod, f in archivos_validos:
+            try:
+                ruta = exportar_inscritos_formato_morado(
+                    cod, df_cursos, self.config.get("feriados", []),
+                    plantilla_path=io.BytesIO(plantilla),
+                    carpeta_salida=self.carpeta_salida,
+                    df_inscritos=self.inscritos(f),
+                    nombres_archivo=nombres_archivo,
+                )
+                exportados.append(ruta)
+            except Exception as e:
+                errores.append({"codigo": normalizar_codigo(cod), "error": str(e)})
+        return {"exportados": exportados, "errores": errores}
+
+    def estado(self):
+        return {
+            "carga_horaria": self.config.get("carga_horaria"),
+            "mes": self.config.get("mes"),
+            "plantilla": self.config.get("plantilla"),
+            "cursos_en_cache": 0 if self._cursos is None else len(self._cursos),
+            "inscritos_en_cache": len(self._inscritos),
+        }
+
+
+class ManejadorExportador(BaseHTTPRequestHandler):
+    # El servidor guarda el ServicioExportador en self.server.servicio
+
+    def _responder(self, codigo, cuerpo):
+        datos = json.dumps(cuerpo, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def _atender(self, accion):
+        try:
+            self._responder(200, accion())
+        except FileNotFoundError as e:
+            self._responder(404, {"error": str(e)})
+        except Exception as e:
+            self._responder(500, {"error": str(e)})
+
+    def do_GET(self):
+        servicio = self.server.servicio
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        rutas = {
+            "/estado": servicio.estado,
+            "/cursos": lambda: servicio.listar_cursos(
+                params.get("idioma"), params.get("modalidad"), params.get("docente")
+            ),
+            "/inscritos": servicio.listar_inscritos,
+            "/prompt": lambda: {"prompt": servicio.prompt(params.get("idioma"))},
+        }
+        if url.path not in rutas:
+            self._responder(404, {"error": f"Ruta no encontrada: {url.path}"})
+            return
+        self._atender(rutas[url.path])
+
+    def do_POST(self):
+        servicio = self.server.servicio
+        if urlparse(self.path).path != "/exportar":
+            self._responder(404, {"error": f"Ruta no encontrada: {self.path}"})
+            return
+        longitud = int(self.headers.get("Content-Length") or 0)
+        try:
+            cuerpo = json.loads(self.rfile.read(longitud) or b"{}")
+        except ValueError:
+            self._responder(400, {"error": "El cuerpo debe ser JSON"})
+            return
+        if not isinstance(cuerpo, dict) or not isinstance(cuerpo.get("codigos", []), (list, type(None))):
+            self._responder(400, {"error": 'Se espera un objeto {"codigos": [...]}'})
+            return
+        self._atender(lambda: servicio.exportar(cuerpo.get("codigos")))
+
+    def log_message(self, format, *args):
+        sys.stderr.write("[servicio] " + (format % args) + "\n")
+
+
+def crear_servidor(servicio, host=HOST_POR_DEFECTO, puerto=PUERTO_POR_DEFECTO):
+    # Con puerto=0 el sistema asigna uno libre (útil para pruebas en localhost)
+    servidor = ThreadingHTTPServer((host, puerto), ManejadorExportador)
+    servidor.servicio = servicio
+    return servidor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio local del exportador de inscritos")
+    parser.add_argument("--host", default=HOST_POR_DEFECTO)
+    parser.add_argument("--puerto", type=int, default=PUERTO_POR_DEFECTO)
+    args = parser.parse_args()
+
+    config = cargar_config()
+    if not all(k in config for k in ["plantilla", "carga_horaria", "mes"]):
+        print("⚠️ Configura primero plantilla, archivo de carga horaria y mes (menu_exportador.py).")
+        sys.exit(1)
+
+    servicio = ServicioExportador(config)
+    print("Leyendo cursos...")
+    servicio.cursos()
+    servicio.plantilla()
+    servidor = crear_servidor(servicio, args.host, args.puerto)
+    print(f"✅ Servicio escuchando en http://{args.host}:{servidor.server_port}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
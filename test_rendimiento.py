@@ -0,0 +1,73 @@
+import os
+import time
+
+# Presupuestos de rendimiento del exportador: cada test mide una métrica sobre las fixtures
+# sintéticas de conftest.py y la compara con benchmark_exportador.json, para que un cambio
+# no vuelva más lenta la exportación de fin de mes sin que nadie lo note.
+
+# Con menos corridas el ruido de la máquina se acerca al umbral; EXPORTADOR_REPETICIONES
+# solo puede subir este mínimo
+REPETICIONES_MINIMAS = 7
+REPETICIONES = max(REPETICIONES_MINIMAS, int(os.environ.get("EXPORTADOR_REPETICIONES") or 0))
+
+
+def tiempo_tipico(funcion, repeticiones=REPETICIONES):
+    # Mediana de varias corridas: a diferencia del mínimo, una corrida excepcionalmente
+    # rápida no mueve la cifra (ni la línea base cuando se guarda)
+    import statistics
+
+    funcion()  # calentamiento: imports perezosos y cachés del sistema de archivos
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos)
+
+
+def test_clean_df_mes_idioma(carga_horaria, mes, df_cursos, comparar_con_base):
+    from exportador_core import clean_df_mes_idioma
+
+    segundos = tiempo_tipico(lambda: clean_df_mes_idioma(carga_horaria, mes))
+    comparar_con_base("clean_df_mes_idioma filas/s", len(df_cursos) / segundos)
+
+
+def test_clean_df_mes_idioma_con_idioma(carga_horaria, mes, df_cursos, comparar_con_base):
+    # Variante del notebook con idioma_input: se lee la hoja completa y se filtra un idioma
+    from exportador_core import clean_df_mes_idioma
+
+    segundos = tiempo_tipico(lambda: clean_df_mes_idioma(carga_horaria, mes, idioma="INGLÉS"))
+    comparar_con_base("clean_df_mes_idioma (idioma) filas/s", len(df_cursos) / segundos)
+
+
+def test_nombre_corto_curso(df_cursos, comparar_con_base):
+    from exportador_core import nombre_corto_curso
+
+    codigos = list(df_cursos["CODIGO"])
+
+    def consultar():
+        for codigo in codigos:
+            nombre_corto_curso(codigo, df_cursos)
+    segundos = tiempo_tipico(consultar)
+    comparar_con_base("nombre_corto_curso consultas/s", len(codigos) / segundos)
+
+
+def test_exportar_inscritos_formato_morado(df_cursos, plantilla, codigos_con_inscritos, carpeta_inscritos, tmp_path,
+                                          comparar_con_base):
+    from exportador_core import exportar_inscritos_formato_morado, nombres_archivo_cursos
+
+    exportados = codigos_con_inscritos
+    nombres_archivo = nombres_archivo_cursos(df_cursos)
+
+    def exportar():
+        for codigo in exportados:
+            exportar_inscritos_formato_morado(
+                codigo, df_cursos, ["2025-06-29"],
+                plantilla_path=plantilla,
+                carpeta_entrada=carpeta_inscritos,
+                carpeta_salida=tmp_path,
+                nombres_archivo=nombres_archivo,
+            )
+    segundos = tiempo_tipico(exportar)
+    assert len(list(tmp_path.glob("*.xlsx"))) == len(exportados)
+    comparar_con_base("exportar_inscritos_formato_morado cursos/s", len(exportados) / segundos)
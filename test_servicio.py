@@ -0,0 +1,74 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from servicio_exportador import ServicioExportador, crear_servidor
+
+# El servicio se prueba entero en localhost: puerto 0 (el sistema asigna uno libre) y la
+# carga horaria y los inscritos sintéticos de conftest.py.
+
+
+@pytest.fixture
+def url_servicio(carga_horaria, carpeta_inscritos, plantilla, mes, tmp_path):
+    config = {"carga_horaria": str(carga_horaria), "mes": mes, "plantilla": str(plantilla), "feriados": []}
+    servicio = ServicioExportador(config, carpeta_inscritos, tmp_path / "output")
+    servidor = crear_servidor(servicio, "127.0.0.1", 0)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    yield f"http://127.0.0.1:{servidor.server_port}"
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def pedir(url, cuerpo=None):
+    # Devuelve (código HTTP, JSON de la respuesta); cuerpo en bytes hace un POST
+    peticion = urllib.request.Request(url, data=cuerpo, method="POST" if cuerpo is not None else "GET")
+    try:
+        with urllib.request.urlopen(peticion) as respuesta:
+            return respuesta.status, json.loads(respuesta.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_cursos(url_servicio, df_cursos):
+    codigo, cursos = pedir(f"{url_servicio}/cursos")
+    assert codigo == 200
+    assert len(cursos) == len(df_cursos)
+    assert {"codigo", "nombre", "idioma", "modalidad", "docente"} <= set(cursos[0])
+
+    codigo, ingles = pedir(f"{url_servicio}/cursos?idioma=INGL%C3%89S&modalidad=REG")
+    assert codigo == 200
+    assert ingles and all(c["idioma"] == "INGLÉS" and c["modalidad"] == "regular" for c in ingles)
+
+
+def test_inscritos(url_servicio, carpeta_inscritos):
+    codigo, inscritos = pedir(f"{url_servicio}/inscritos")
+    assert codigo == 200
+    assert len(inscritos) == len(list(carpeta_inscritos.glob("Inscritos_*.xlsx")))
+    assert {i["estado"] for i in inscritos} == {"emparejado"}
+
+
+def test_exportar(url_servicio, df_cursos, codigos_con_inscritos, tmp_path):
+    pedidos = [str(c) for c in codigos_con_inscritos[:2]]
+    sin_inscritos = next(str(c) for c in df_cursos["CODIGO"] if c not in codigos_con_inscritos)
+    cuerpo = json.dumps({"codigos": pedidos + [sin_inscritos, "99999"]}).encode()
+    codigo, resultado = pedir(f"{url_servicio}/exportar", cuerpo)
+    assert codigo == 200
+    assert len(resultado["exportados"]) == 2
+    assert len(list((tmp_path / "output").glob("*.xlsx"))) == 2
+    assert {e["codigo"] for e in resultado["errores"]} == {sin_inscritos, "99999"}
+
+
+@pytest.mark.parametrize("cuerpo", [b"no es json", b"[1, 2]", b'{"codigos": "25060001"}', b'{"codigos": 5}'])
+def test_exportar_cuerpo_invalido(url_servicio, cuerpo):
+    codigo, resultado = pedir(f"{url_servicio}/exportar", cuerpo)
+    assert codigo == 400
+    assert "error" in resultado
+
+
+def test_ruta_inexistente(url_servicio):
+    assert pedir(f"{url_servicio}/nada")[0] == 404
+    assert pedir(f"{url_servicio}/nada", b"{}")[0] == 404
@@ -0,0 +1,240 @@
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from exportador_core import (
+    cargar_config, clean_df_mes_idioma, nombre_corto_curso,
+    exportar_inscritos_formato_morado, resolver_inscritos, archivos_emparejados, nombres_archivo_cursos,
+)
+
+# Modo vigilancia: detecta archivos Inscritos_<CODIGO>.xlsx nuevos o modificados en
+# inscritos/ y exporta solo los cursos afectados. Usa inotify en Linux y, si no está
+# disponible, revisa los mtime de la carpeta periódicamente.
+#
+# Uso: python vigilar_inscritos.py [--espera 2] [--intervalo 1] [--trabajadores 2] [--polling]
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+
+def es_archivo_inscritos(nombre):
+    return nombre.startswith("Inscritos_") and nombre.endswith(".xlsx") and not nombre.startswith("~$")
+
+
+def _firma(ruta):
+    try:
+        st = os.stat(ruta)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class VigilantePolling:
+    # Compara los mtime/tamaños de la carpeta en cada llamada
+    def __init__(self, carpeta):
+        self.carpeta = Path(carpeta)
+        self._vistos = self._escanear()
+
+    def _escanear(self):
+        vistos = {}
+        for entrada in os.scandir(self.carpeta):
+            if entrada.is_file() and es_archivo_inscritos(entrada.name):
+                st = entrada.stat()
+                vistos[entrada.name] = (st.st_mtime_ns, st.st_size)
+        return vistos
+
+    def esperar(self, timeout):
+        time.sleep(timeout)
+        actuales = self._escanear()
+        cambiados = {n for n, firma in actuales.items() if self._vistos.get(n) != firma}
+        self._vistos = actuales
+        return cambiados
+
+    def cerrar(self):
+        pass
+
+
+class VigilanteInotify:
+    # inotify vía ctypes (solo Linux); lanza OSError si no se puede inicializar
+    def __init__(self, carpeta):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falló")
+        wd = libc.inotify_add_watch(self._fd, os.fsencode(str(carpeta)), IN_CLOSE_WRITE | IN_MOVED_TO)
+        if wd < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch falló")
+
+    def esperar(self, timeout):
+        import select
+        import struct
+
+        listos, _, _ = select.select([self._fd], [], [], timeout)
+        if not listos:
+            return set()
+        datos = os.read(self._fd, 64 * 1024)
+        cambiados = set()
+        i = 0
+        # Cada evento: wd, mask, cookie, len (int, uint32 x3) seguido del nombre con relleno de \0
+        while i + 16 <= len(datos):
+            _, _, _, largo = struct.unpack_from("iIII", datos, i)
+            nombre = datos[i + 16:i + 16 + largo].rstrip(b"\0").decode("utf-8", errors="replace")
+            if es_archivo_inscritos(nombre):
+                cambiados.add(nombre)
+            i += 16 + largo
+        return cambiados
+
+    def cerrar(self):
+        os.close(self._fd)
+
+
+def crear_vigilante(carpeta, forzar_polling=False):
+    if not forzar_polling and sys.platform.startswith("linux"):
+        try:
+            return VigilanteInotify(carpeta)
+        except (OSError, AttributeError):
+            pass
+    return VigilantePolling(carpeta)
+
+
+class Antirrebote:
+    # Un archivo está listo cuando su mtime/tamaño no cambian durante `espera` segundos,
+    # así no se exportan archivos que todavía se están copiando o guardando.
+    def __init__(self, carpeta, espera=2.0):
+        self.carpeta = Path(carpeta)
+        self.espera = espera
+        self._pendientes = {}  # nombre -> (firma, instante del último cambio)
+
+    def registrar(self, nombres, ahora=None):
+        ahora = time.monotonic() if ahora is None else ahora
+        for nombre in nombres:
+            self._pendientes[nombre] = (_firma(self.carpeta / nombre), ahora)
+
+    def listos(self, ahora=None):
+        ahora = time.monotonic() if ahora is None else ahora
+        listos = []
+        for nombre, (firma, instante) in list(self._pendientes.items()):
+            actual = _firma(self.carpeta / nombre)
+            if actual is None:
+                del self._pendientes[nombre]
+            elif actual != firma:
+                self._pendientes[nombre] = (actual, ahora)
+            elif ahora - instante >= self.espera:
+                listos.append(nombre)
+                del self._pendientes[nombre]
+        return sorted(listos)
+
+    def hay_pendientes(self):
+        return bool(self._pendientes)
+
+
+def _exportar_curso(cod, archivo, df_cursos, feriados, plantilla, carpeta_entrada, carpeta_salida, nombres_archivo):
+    # Función de nivel superior para poder ejecutarse en otro proceso
+    return exportar_inscritos_formato_morado(
+        cod, df_cursos, feriados,
+        plantilla_path=plantilla,
+        carpeta_entrada=carpeta_entrada,
+        carpeta_salida=carpeta_salida,
+        nombres_archivo=nombres_archivo,
+        archivos_inscritos={cod: archivo},
+    )
+
+
+def resolver_cambiados(archivos, df_cursos, carpeta_entrada):
+    # Filas de resolver_inscritos (igual que el menú) para los archivos que cambiaron
+    tabla = resolver_inscritos(carpeta_entrada, df_cursos)
+    return tabla[tabla["ARCHIVO"].map(lambda f: f.name).isin({f.name for f in archivos})]
+
+
+def exportar_afectados(archivos, df_cursos, config, carpeta_entrada, carpeta_salida, trabajadores=2):
+    # Resuelve los archivos contra los cursos y exporta en paralelo acotado
+    tabla = resolver_cambiados(archivos, df_cursos, carpeta_entrada)
+    for f in tabla.loc[tabla["ESTADO"] == "sin curso", "ARCHIVO"]:
+        print(f"⚠️ {f.name} no corresponde a ningún curso del mes; se ignora.")
+    for f in tabla.loc[tabla["ESTADO"] == "duplicado", "ARCHIVO"]:
+        print(f"⚠️ {f.name} tiene un archivo más reciente del mismo curso; se ignora.")
+    archivos_validos = archivos_emparejados(tabla)
+    if not archivos_validos:
+        return []
+
+    nombres_archivo = nombres_archivo_cursos(df_cursos)
+    exportados = []
+    with ProcessPoolExecutor(max_workers=max(1, trabajadores)) as pool:
+        futuros = {
+            pool.submit(
+                _exportar_curso, cod, f, df_cursos, config.get("feriados", []),
+                config["plantilla"], carpeta_entrada, carpeta_salida, nombres_archivo
+            ): (cod, f)
+            for cod, f in archivos_validos
+        }
+        for futuro in as_completed(futuros):
+            cod, f = futuros[futuro]
+            try:
+                exportados.append(futuro.result())
+            except Exception as e:
+                print(f"❌ Error exportando {f.name}: {e}")
+    return exportados
+
+
+def vigilar(config, carpeta_entrada="inscritos/", carpeta_salida="./output/",
+            espera=2.0, intervalo=1.0, trabajadores=2, forzar_polling=False):
+    carpeta = Path(carpeta_entrada)
+    carpeta.mkdir(parents=True, exist_ok=True)
+    vigilante = crear_vigilante(carpeta, forzar_polling)
+    antirrebote = Antirrebote(carpeta, espera)
+    df_cursos, firma_cursos = None, None
+    modo = "inotify" if isinstance(vigilante, VigilanteInotify) else "polling"
+    print(f"👀 Vigilando {carpeta}/ ({modo}). Ctrl+C para salir.")
+    try:
+        while True:
+            # Con archivos pendientes se revisa más seguido para respetar el antirrebote
+            timeout = min(intervalo, espera) if antirrebote.hay_pendientes() else intervalo
+            antirrebote.registrar(vigilante.esperar(timeout))
+            listos = antirrebote.listos()
+            if not listos:
+                continue
+
+            # La carga horaria solo se vuelve a limpiar si el archivo cambió
+            firma = (_firma(config["carga_horaria"]), config["mes"])
+            if firma != firma_cursos:
+                df_cursos = clean_df_mes_idioma(config["carga_horaria"], config["mes"])
+                firma_cursos = firma
+
+            archivos = [carpeta / nombre for nombre in listos]
+            print("Archivos nuevos o modificados:", ", ".join(listos))
+            for cod, f in archivos_emparejados(resolver_cambiados(archivos, df_cursos, carpeta)):
+                print(f"- {nombre_corto_curso(cod, df_cursos)}")
+            exportar_afectados(archivos, df_cursos, config, carpeta_entrada, carpeta_salida, trabajadores)
+    except KeyboardInterrupt:
+        print("\nVigilancia detenida.")
+    finally:
+        vigilante.cerrar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta automáticamente los inscritos que lleguen a inscritos/")
+    parser.add_argument("--espera", type=float, default=2.0, help="segundos sin cambios antes de exportar un archivo")
+    parser.add_argument("--intervalo", type=float, default=1.0, help="segundos entre revisiones")
+    parser.add_argument("--trabajadores", type=int, default=2, help="exportaciones en paralelo")
+    parser.add_argument("--polling", action="store_true", help="no usar inotify aunque esté disponible")
+    args = parser.parse_args()
+
+    config = cargar_config()
+    if not all(k in config for k in ["plantilla", "carga_horaria", "mes"]):
+        print("⚠️ Configura primero plantilla, archivo de carga horaria y mes (menu_exportador.py).")
+        sys.exit(1)
+    vigilar(config, espera=args.espera, intervalo=args.intervalo,
+            trabajadores=args.trabajadores, forzar_polling=args.polling)
+
+
+if __name__ == "__main__":
+    main()